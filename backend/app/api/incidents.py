@@ -18,11 +18,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/incidents", response_model=List[Incident])
+@router.get("/incidents", response_model=None)
 async def list_incidents(
     active_only: bool = True,
     stream_id: Optional[str] = None
-):
+) -> List[dict]:
     """
     List all incidents.
     
@@ -34,7 +34,7 @@ async def list_incidents(
         stream_id=stream_id,
         active_only=active_only
     )
-    return incidents
+    return [i.model_dump(mode='json') for i in incidents]
 
 
 @router.get("/incidents/{incident_id}", response_model=Incident)
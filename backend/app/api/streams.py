@@ -13,20 +13,28 @@ Removed (see implementation_plan.md):
 - /scte35-events, /alerts (replaced by incidents)
 """
 
-import json
+import asyncio
+import hashlib
+import os
+import time
 import uuid
 import logging
+from email.utils import formatdate
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Optional
+from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
+import aiofiles
+import aiofiles.os
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 
 from app.config import settings
 from app.models import (
     StreamConfig, StreamSummary, StreamDetails, StreamStatus,
-    TimelineEvent
+    from_epoch_ns
 )
 from app.services.stream_monitor import stream_monitor
 from app.services.incident_service import incident_service
@@ -37,71 +45,277 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/streams", tags=["streams"])
 
 # =============================================================================
-# PERSISTENCE (Simple JSON file)
+# PERSISTENCE (JSON snapshot + append-only change log)
 # =============================================================================
 
-STREAMS_FILE = Path(settings.DATA_DIR) / "streams.json"
+STREAMS_FILE = Path(settings.DATA_DIR) / "streams.json"  # compacted snapshot
+STREAMS_LOG = Path(settings.DATA_DIR) / "streams.log"    # JSONL ops since snapshot
 
+# Compact once the log outgrows the live stream set by this factor
+COMPACT_LOG_FACTOR = 4
+COMPACT_MIN_LINES = 32
 
-def save_streams():
-    """Save streams to JSON file."""
+# Bursts of compaction requests are coalesced into a single write
+SAVE_DEBOUNCE_SECONDS = 0.2
+_save_requested = asyncio.Event()
+
+# Serializes log appends against compaction (snapshot write + log truncate)
+_persist_lock = asyncio.Lock()
+_log_lines = 0
+
+# Digest of the last snapshot written/loaded, so unchanged snapshots skip the disk
+_last_saved_digest: Optional[bytes] = None
+
+
+def _digest(blob: bytes) -> bytes:
+    return hashlib.blake2b(blob, digest_size=8).digest()
+
+
+def _config_to_dict(config: StreamConfig) -> dict:
+    return {
+        "id": config.id,
+        "name": config.name,
+        "manifest_url": config.manifest_url,
+        "enabled": config.enabled,
+        "created_at": config.created_at.isoformat()
+    }
+
+
+def _config_from_dict(item: dict) -> StreamConfig:
+    # Handle old format gracefully
+    created_at = item.get('created_at')
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    else:
+        created_at = datetime.utcnow()
+    
+    return StreamConfig(
+        id=item['id'],
+        name=item['name'],
+        manifest_url=item['manifest_url'],
+        enabled=item.get('enabled', True),
+        created_at=created_at
+    )
+
+
+def _fsync_dir(path: Path):
+    """Make a rename in `path` durable (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
     try:
-        STREAMS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        data = [
-            {
-                "id": config.id,
-                "name": config.name,
-                "manifest_url": config.manifest_url,
-                "enabled": config.enabled,
-                "created_at": config.created_at.isoformat()
-            }
-            for config in stream_monitor.active_streams.values()
-        ]
-        with open(STREAMS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        logger.debug(f"Saved {len(data)} streams to persistence")
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _log_needs_compaction() -> bool:
+    limit = COMPACT_LOG_FACTOR * len(stream_monitor.active_streams)
+    return _log_lines > max(COMPACT_MIN_LINES, limit)
+
+
+async def _append_event(op: str, data: dict):
+    """
+    Append one op to the stream log - O(1) per mutation, no full rewrite.
+    
+    The append is fsynced before returning, so an acknowledged add/delete
+    survives power loss, not just a process crash.
+    """
+    global _log_lines
+    try:
+        line = orjson.dumps({"op": op, "data": data}) + b"\n"
+        async with _persist_lock:
+            STREAMS_LOG.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(STREAMS_LOG, 'ab') as f:
+                await f.write(line)
+                await f.flush()
+                await asyncio.to_thread(os.fsync, f.fileno())
+            _log_lines += 1
+    except Exception as e:
+        logger.error(f"Failed to log stream {op}: {e}")
+        return
+    
+    if _log_needs_compaction():
+        request_compaction()
+
+
+async def log_stream_added(config: StreamConfig):
+    await _append_event("add", _config_to_dict(config))
+
+
+async def log_stream_deleted(stream_id: str):
+    await _append_event("del", {"id": stream_id})
+
+
+async def save_streams():
+    """
+    Compact persistence: write a full snapshot, then truncate the log.
+    
+    The snapshot is written to a temp file, fsynced, renamed into place
+    and the directory fsynced before the log is truncated, so a crash or
+    power loss leaves either the old or the new snapshot (plus the log).
+    Replaying the log on top of either is idempotent.
+    """
+    global _last_saved_digest, _log_lines
+    try:
+        async with _persist_lock:
+            STREAMS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Snapshot first so concurrent add/remove can't mutate the dict mid-iteration
+            configs = list(stream_monitor.active_streams.values())
+            data = [_config_to_dict(config) for config in configs]
+            blob = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            
+            digest = _digest(blob)
+            if digest != _last_saved_digest:
+                tmp_file = STREAMS_FILE.with_suffix(".json.tmp")
+                async with aiofiles.open(tmp_file, 'wb') as f:
+                    await f.write(blob)
+                    await f.flush()
+                    await asyncio.to_thread(os.fsync, f.fileno())
+                await aiofiles.os.replace(tmp_file, STREAMS_FILE)
+                await asyncio.to_thread(_fsync_dir, STREAMS_FILE.parent)
+                _last_saved_digest = digest
+            
+            # Snapshot now covers every logged op
+            async with aiofiles.open(STREAMS_LOG, 'wb'):
+                pass
+            _log_lines = 0
+        logger.debug(f"Compacted {len(data)} streams to persistence snapshot")
     except Exception as e:
         logger.error(f"Failed to save streams: {e}")
 
 
+def request_compaction():
+    """Schedule a debounced compaction (picked up by persistence_writer)."""
+    _save_requested.set()
+
+
+async def persistence_writer():
+    """
+    Single compaction coroutine, started in the app lifespan.
+    
+    Waits for a compaction request, then sleeps briefly so that a burst
+    of requests produces one snapshot write instead of N.
+    """
+    while True:
+        await _save_requested.wait()
+        await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+        _save_requested.clear()
+        await save_streams()
+
+
+async def flush_pending_save():
+    """Compact immediately if a compaction is still pending (called on shutdown)."""
+    if _save_requested.is_set():
+        _save_requested.clear()
+        await save_streams()
+
+
+async def _read_file(path: Path) -> Optional[bytes]:
+    if not path.exists():
+        return None
+    async with aiofiles.open(path, 'rb') as f:
+        return await f.read()
+
+
 async def load_persisted_streams():
-    """Load streams from JSON file on startup."""
+    """Load the snapshot and replay the change log on startup."""
+    global _last_saved_digest, _log_lines
     try:
-        if not STREAMS_FILE.exists():
+        snapshot = await _read_file(STREAMS_FILE)
+        log = await _read_file(STREAMS_LOG)
+        if snapshot is None and log is None:
             logger.info("No persisted streams file found")
             return
         
-        with open(STREAMS_FILE, 'r') as f:
-            data = json.load(f)
+        items: Dict[str, dict] = {}
+        if snapshot is not None:
+            _last_saved_digest = _digest(snapshot)
+            for item in orjson.loads(snapshot):
+                items[item['id']] = item
         
-        for item in data:
-            # Handle old format gracefully
-            created_at = item.get('created_at')
-            if isinstance(created_at, str):
-                created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            else:
-                created_at = datetime.utcnow()
-            
-            config = StreamConfig(
-                id=item['id'],
-                name=item['name'],
-                manifest_url=item['manifest_url'],
-                enabled=item.get('enabled', True),
-                created_at=created_at
-            )
+        # Replay ops in order; re-adding or deleting twice is harmless
+        if log is not None:
+            for line in log.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Torn write from a crash mid-append
+                    logger.warning("Skipping unreadable stream log line")
+                    continue
+                _log_lines += 1
+                if record["op"] == "add":
+                    items[record["data"]["id"]] = record["data"]
+                elif record["op"] == "del":
+                    items.pop(record["data"]["id"], None)
+        
+        configs = [_config_from_dict(item) for item in items.values()]
+        
+        # add_stream only registers state and schedules the first poll (it never
+        # awaits I/O), so starting streams one by one costs nothing to overlap
+        for config in configs:
             await stream_monitor.add_stream(config)
         
-        logger.info(f"Loaded {len(data)} streams from persistence")
+        logger.info(f"Loaded {len(configs)} streams from persistence")
+        
+        if _log_needs_compaction():
+            await save_streams()
     except Exception as e:
         logger.error(f"Failed to load streams: {e}")
 
 
+# =============================================================================
+# DEPENDENCIES
+# =============================================================================
+
+async def require_stream(stream_id: str) -> StreamConfig:
+    """
+    Resolve a monitored stream or 404.
+    
+    Async on purpose: sync dependencies are run in the threadpool.
+    """
+    config = stream_monitor.active_streams.get(stream_id)
+    if config is None:
+        raise HTTPException(status_code=404, detail="Stream not found")
+    return config
+
+
+# =============================================================================
+# CONDITIONAL GET HELPERS (dashboard polls; most polls see no change)
+# =============================================================================
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """
+    True if the client's cached copy (If-None-Match) is still current.
+    
+    The header may list several tags or be "*"; GET uses weak comparison,
+    so W/ prefixes are ignored on both sides.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def _thumbnail_validators(stat_result: os.stat_result) -> tuple:
+    """Derive (etag, last_modified) from a thumbnail's cached stat."""
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    return etag, last_modified
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 
-@router.get("", response_model=List[StreamSummary])
-async def list_streams():
+@router.get("", response_model=None)
+async def list_streams(request: Request) -> Response:
     """
     List all monitored streams with health summaries.
     
@@ -109,8 +323,20 @@ async def list_streams():
     - Current health state (GREEN/YELLOW/RED)
     - Whether there's an active incident
     - Latest thumbnail URL
+    
+    Served from the monitor's pre-serialized snapshot, so polling
+    cost doesn't grow with the number of streams. Returns 304 when
+    the client's ETag matches the current snapshot version.
     """
-    return stream_monitor.list_streams()
+    etag = stream_monitor.get_summaries_etag()
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    return Response(
+        stream_monitor.get_summaries_json(),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @router.get("/{stream_id}", response_model=StreamDetails)
@@ -150,7 +376,7 @@ async def create_stream(name: str, manifest_url: str):
     )
     
     await stream_monitor.add_stream(config)
-    save_streams()
+    await log_stream_added(config)
     
     # Return initial summary
     return StreamSummary(
@@ -163,144 +389,198 @@ async def create_stream(name: str, manifest_url: str):
 
 
 @router.delete("/{stream_id}")
-async def delete_stream(stream_id: str):
+async def delete_stream(stream_id: str, _: StreamConfig = Depends(require_stream)):
     """Remove a stream from monitoring."""
-    if stream_id not in stream_monitor.active_streams:
-        raise HTTPException(status_code=404, detail="Stream not found")
-    
     await stream_monitor.remove_stream(stream_id)
-    save_streams()
+    await log_stream_deleted(stream_id)
     
     return {"status": "deleted", "stream_id": stream_id}
 
 
-@router.get("/{stream_id}/timeline", response_model=List[TimelineEvent])
+@router.get("/{stream_id}/timeline", response_model=None)
 async def get_timeline(
     stream_id: str,
-    limit: int = Query(50, le=100)
-):
+    limit: int = Query(50, le=100),
+    _: StreamConfig = Depends(require_stream)
+) -> Response:
     """
     Get recent timeline events for a stream.
     
     This returns the last N events, regardless of whether
     there's an active incident. Useful for recent history.
     """
-    if stream_id not in stream_monitor.active_streams:
-        raise HTTPException(status_code=404, detail="Stream not found")
-    
-    # Get from active incident if exists
-    incident = incident_service.get_active_incident(stream_id)
-    if incident:
-        return incident.timeline[-limit:]
-    
-    # Otherwise return empty (no incident = no timeline in our model)
-    return []
+    # Active incident timeline, pre-serialized (no incident = empty timeline in our model)
+    return Response(
+        incident_service.get_timeline_json(stream_id, limit),
+        media_type="application/json"
+    )
 
 
 @router.get("/{stream_id}/thumbnail")
-async def get_thumbnail(stream_id: str):
+async def get_thumbnail(
+    stream_id: str,
+    request: Request,
+    _: StreamConfig = Depends(require_stream)
+):
     """Get the latest thumbnail URL for a stream."""
-    if stream_id not in stream_monitor.active_streams:
-        raise HTTPException(status_code=404, detail="Stream not found")
-    
-    thumb_path = thumbnail_generator.get_cached_thumbnail(stream_id)
+    cached = thumbnail_generator.get_cached_thumbnail_stat(stream_id)
     
-    if not thumb_path:
+    if not cached:
         raise HTTPException(status_code=404, detail="No thumbnail available")
     
-    return {
-        "thumbnail_url": f"/data/thumbnails/{Path(thumb_path).name}",
-        "stream_id": stream_id
-    }
+    _, stat_result = cached
+    etag, last_modified = _thumbnail_validators(stat_result)
+    headers = {"ETag": etag, "Last-Modified": last_modified}
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse(
+        {
+            "thumbnail_url": thumbnail_generator.get_cached_thumbnail_url(stream_id),
+            "stream_id": stream_id
+        },
+        headers=headers
+    )
 
 
 @router.get("/{stream_id}/thumbnail/file")
-async def get_thumbnail_file(stream_id: str):
+async def get_thumbnail_file(
+    stream_id: str,
+    request: Request,
+    _: StreamConfig = Depends(require_stream)
+):
     """Get the thumbnail image file directly."""
-    if stream_id not in stream_monitor.active_streams:
-        raise HTTPException(status_code=404, detail="Stream not found")
+    # Stat captured at write time: no exists()/stat() syscalls per request.
+    # The file can still vanish behind the cache (cleanup, manual delete).
+    cached = thumbnail_generator.get_cached_thumbnail_stat(stream_id)
+    
+    if not cached:
+        raise HTTPException(status_code=404, detail="No thumbnail available")
     
-    thumb_path = thumbnail_generator.get_cached_thumbnail(stream_id)
+    thumb_path, stat_result = cached
+    etag, last_modified = _thumbnail_validators(stat_result)
+    headers = {
+        "Cache-Control": "public, max-age=30",
+        "ETag": etag,
+        "Last-Modified": last_modified
+    }
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
     
-    if not thumb_path or not Path(thumb_path).exists():
+    # Read here rather than via FileResponse: it sends the 200 headers before
+    # opening the file, so a missing file would surface as a broken response
+    try:
+        async with aiofiles.open(thumb_path, 'rb') as f:
+            content = await f.read()
+    except FileNotFoundError:
+        thumbnail_generator.invalidate_cached_thumbnail(stream_id, thumb_path)
         raise HTTPException(status_code=404, detail="No thumbnail available")
     
-    return FileResponse(
-        thumb_path,
-        media_type="image/jpeg",
-        headers={"Cache-Control": "public, max-age=30"}
-    )
+    return Response(content, media_type="image/jpeg", headers=headers)
 
 
 # =============================================================================
 # ANALYSIS MODE ENDPOINTS
 # =============================================================================
 
-@router.get("/{stream_id}/metrics/history")
+def _history_stats(ttfb: np.ndarray, download_ratio: np.ndarray, is_error: np.ndarray) -> dict:
+    """
+    Range aggregates for the Analysis Mode header, as array reductions.
+    
+    Error points carry zeroed ttfb/ratio, so they're masked out of the
+    latency/throughput stats and only counted.
+    """
+    ok = ~is_error
+    ok_ttfb = ttfb[ok]
+    ok_ratio = download_ratio[ok]
+    if not ok_ttfb.size:
+        return {
+            "sample_count": int(is_error.size),
+            "error_count": int(is_error.size),
+            "avg_ttfb_ms": None,
+            "p95_ttfb_ms": None,
+            "max_ttfb_ms": None,
+            "avg_download_ratio": None,
+            "min_download_ratio": None
+        }
+    return {
+        "sample_count": int(is_error.size),
+        "error_count": int(is_error.size - ok_ttfb.size),
+        "avg_ttfb_ms": float(ok_ttfb.mean()),
+        "p95_ttfb_ms": float(np.percentile(ok_ttfb, 95)),
+        "max_ttfb_ms": float(ok_ttfb.max()),
+        "avg_download_ratio": float(ok_ratio.mean()),
+        "min_download_ratio": float(ok_ratio.min())
+    }
+
+
+@router.get("/{stream_id}/metrics/history", response_model=None)
 async def get_metrics_history(
     stream_id: str,
-    minutes: int = Query(30, le=60)
-):
+    minutes: int = Query(30, le=60),
+    _: StreamConfig = Depends(require_stream)
+) -> Response:
     """
     Get metrics history for Analysis Mode charts.
     
-    Returns time series data for:
+    Returns columnar time series data for:
     - TTFB over time
     - Download ratio over time
     - Error rate per minute
     - Health state changes
+    - Range stats (avg / p95 / max TTFB, avg / min ratio, error count)
     
     This is the ONLY place charts should get their data.
     """
-    if stream_id not in stream_monitor.active_streams:
-        raise HTTPException(status_code=404, detail="Stream not found")
+    # Get metrics from history ring (created alongside the stream)
+    ring = stream_monitor.metrics_history[stream_id]
+    
+    # Filter to requested time range (binary search on sorted timestamps)
+    cutoff_ns = time.time_ns() - minutes * 60_000_000_000
+    timestamps, ttfb, download_ratio, is_error = ring.since(cutoff_ns)
     
-    # Get metrics from window
-    if stream_id not in stream_monitor.metrics_windows:
-        return {"data_points": [], "health_timeline": []}
-    
-    window = stream_monitor.metrics_windows[stream_id]
-    metrics = list(window.metrics)
-    
-    # Filter to requested time range
-    cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-    
-    # Build data points
-    data_points = []
-    for m in metrics:
-        if m.timestamp > cutoff:
-            data_points.append({
-                "timestamp": m.timestamp.isoformat(),
-                "ttfb_ms": m.ttfb,
-                "download_ratio": m.download_ratio,
-                "is_error": m.is_error
-            })
-    
-    # Build health timeline from history if available
-    health_timeline = []
-    if stream_id in stream_monitor.health_history:
-        for entry in stream_monitor.health_history[stream_id]:
-            if entry["timestamp"] > cutoff:
-                health_timeline.append({
-                    "timestamp": entry["timestamp"].isoformat(),
-                    "state": entry["state"]
-                })
-    
-    # Calculate error rate per minute
-    error_counts_by_minute = {}
-    for m in metrics:
-        if m.timestamp > cutoff and m.is_error:
-            minute_key = m.timestamp.replace(second=0, microsecond=0).isoformat()
-            error_counts_by_minute[minute_key] = error_counts_by_minute.get(minute_key, 0) + 1
+    # Data points are columnar: orjson serializes the NumPy arrays directly,
+    # so no per-point Python dicts are built. Timestamps are epoch milliseconds.
+    data_points = {
+        "timestamp_ms": timestamps // 1_000_000,
+        "ttfb_ms": ttfb,
+        "download_ratio": download_ratio,
+        "is_error": is_error
+    }
+    
+    # Build health timeline from the (timestamp_ns, state) transition log.
+    # Entries are chronological: walk back from the newest, stop at the cutoff.
+    # The last transition at or before the cutoff is the state the range
+    # opens in (a stream RED for the whole range has no transition inside it).
+    recent = []
+    for timestamp_ns, state in reversed(stream_monitor.health_history.get(stream_id, ())):
+        if timestamp_ns <= cutoff_ns:
+            recent.append((cutoff_ns, state))
+            break
+        recent.append((timestamp_ns, state))
+    health_timeline = [
+        {"timestamp": from_epoch_ns(timestamp_ns).isoformat(), "state": state}
+        for timestamp_ns, state in reversed(recent)
+    ]
+    
+    # Calculate error rate per minute (bucket error timestamps by minute)
+    error_minutes = timestamps[is_error] // 60_000_000_000
+    minute_buckets, counts = np.unique(error_minutes, return_counts=True)
+    minute_keys = np.datetime_as_string(minute_buckets.astype('datetime64[m]'), unit='s')
     
     error_rate_series = [
         {"timestamp": ts, "error_count": count}
-        for ts, count in sorted(error_counts_by_minute.items())
+        for ts, count in zip(minute_keys.tolist(), counts.tolist())
     ]
     
-    return {
-        "stream_id": stream_id,
-        "data_points": data_points,
-        "health_timeline": health_timeline,
-        "error_rate_series": error_rate_series
-    }
+    payload = orjson.dumps(
+        {
+            "stream_id": stream_id,
+            "data_points": data_points,
+            "stats": _history_stats(ttfb, download_ratio, is_error),
+            "health_timeline": health_timeline,
+            "error_rate_series": error_rate_series
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY
+    )
+    return Response(payload, media_type="application/json")
@@ -31,6 +31,7 @@ class Settings(BaseSettings):
     
     # Monitoring
     MANIFEST_POLL_INTERVAL: int = 5  # seconds
+    HLS_WINDOW_SIZE: int = 10  # Typical live playlist length (segments); bounds seen-segment memory
     SPRITE_SEGMENT_COUNT: int = 100  # Create sprite every N segments
     THUMBNAIL_WIDTH: int = 160
     THUMBNAIL_HEIGHT: int = 90
@@ -44,8 +45,12 @@ class Settings(BaseSettings):
     
     # Performance
     MAX_CONCURRENT_DOWNLOADS: int = 10
+    MAX_CONN_PER_HOST: int = 20  # Keep-alive pool size per origin host
+    MAX_CONCURRENT_SEGMENTS: int = 4  # Segment workers per stream
+    SEGMENT_QUEUE_SIZE: int = 32  # Pending segments per stream before dropping
     DOWNLOAD_TIMEOUT: int = 30
-    SEGMENT_BUFFER_SIZE: int = 8192
+    SEGMENT_BUFFER_SIZE: int = 65536  # Segment download read chunk (bytes)
+    MAX_SEGMENT_BYTES: int = 64 * 1024 * 1024  # Abort segment downloads larger than this
     
     # Optional S3
     S3_ENABLED: bool = False
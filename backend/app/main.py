@@ -7,8 +7,10 @@ See implementation_plan.md for design decisions.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from pathlib import Path
 
@@ -16,6 +18,7 @@ from app.config import settings
 from app.api import streams, websocket
 from app.api import incidents  # Incident endpoints
 from app.services.stream_monitor import stream_monitor
+from app.services.incident_service import incident_service
 from app.models import HealthStatus
 from datetime import datetime
 
@@ -33,20 +36,31 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager for startup and shutdown."""
     # Startup
     logger.info(f"Starting HLS Stream Operations v2.0.0")
+    # uvloop when available (uvicorn picks it up via --loop uvloop / loop="auto")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     
     # Start stream monitor
     await stream_monitor.start()
     
     # Load persisted streams
-    from app.api.streams import load_persisted_streams
+    from app.api.streams import load_persisted_streams, persistence_writer, flush_pending_save
     await load_persisted_streams()
     
+    # Single background writer for debounced stream persistence
+    writer_task = asyncio.create_task(persistence_writer())
+    
     logger.info("Application started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    writer_task.cancel()
+    try:
+        await writer_task
+    except asyncio.CancelledError:
+        pass
+    await flush_pending_save()
     await stream_monitor.stop()
     logger.info("Application shut down")
 
@@ -56,6 +70,7 @@ app = FastAPI(
     title="HLS Stream Operations",
     version="2.0.0",
     description="Layered HLS monitoring with incident detection and root-cause classification",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -92,8 +107,6 @@ async def root():
 @app.get("/health", response_model=HealthStatus)
 async def health_check():
     """System health check endpoint."""
-    from app.services.incident_service import incident_service
-    
     return HealthStatus(
         status="healthy",
         timestamp=datetime.utcnow(),
@@ -105,10 +118,20 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
+    
+    # libuv-based loop: faster task scheduling and socket I/O for the
+    # many-streams polling workload. Optional - falls back to asyncio.
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
-        log_level="info"
+        log_level="info",
+        loop=loop
     )
@@ -11,12 +11,35 @@ Non-goals (documented):
 - Sprite generation
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing import Optional, List, Dict, Any, Deque
+from datetime import datetime, timedelta
+from collections import deque
 from enum import Enum
 
 
+# For models never mutated after construction (the monitor replaces them
+# wholesale), so instances can be shared safely across cached snapshots.
+FROZEN = ConfigDict(frozen=True)
+
+
+# =============================================================================
+# TIME HELPERS (hot paths keep int epoch nanoseconds, not datetime)
+# =============================================================================
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_ns(dt: datetime) -> int:
+    """Convert a naive UTC datetime to integer epoch nanoseconds."""
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def from_epoch_ns(ns: int) -> datetime:
+    """Convert integer epoch nanoseconds to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
 # =============================================================================
 # STREAM STATUS
 # =============================================================================
@@ -64,6 +87,8 @@ class RootCause(BaseModel):
     "I chose rules over ML because operators need to trust the diagnosis.
     Every classification has clear evidence they can verify."
     """
+    model_config = FROZEN
+    
     label: str  # "Network Congestion", "Origin Outage", etc.
     confidence: RootCauseConfidence
     evidence: List[str] = Field(default_factory=list)  # ["High TTFB (720ms)", "Download ratio 0.4x"]
@@ -77,6 +102,8 @@ class StreamHealth(BaseModel):
         state: RED
         reason: "4 segment timeouts and avg TTFB > 1200ms in last 2 minutes"
     """
+    model_config = FROZEN
+    
     state: HealthState = HealthState.GREEN
     reason: str = "Stream healthy"
     last_updated: datetime = Field(default_factory=datetime.utcnow)
@@ -93,6 +120,8 @@ class StreamHealth(BaseModel):
 
 class StreamConfig(BaseModel):
     """Stream configuration for monitoring."""
+    model_config = FROZEN
+    
     id: str
     name: str
     manifest_url: str
@@ -113,16 +142,24 @@ class SegmentMetrics(BaseModel):
     - download_time: Total download time
     - download_ratio: download_time / segment_duration (< 1.0 = realtime OK)
     """
+    model_config = FROZEN
+    
     uri: str
     segment_duration: float  # seconds
     ttfb: float  # milliseconds
     download_time: float  # milliseconds
     download_ratio: float  # download_time / segment_duration
     segment_size_bytes: int
-    timestamp: datetime
+    timestamp_ns: int  # epoch nanoseconds (UTC), from time.time_ns()
     sequence_number: Optional[int] = None
     is_error: bool = False
     error_message: Optional[str] = None
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """UTC datetime, only materialized when serialized for the API."""
+        return from_epoch_ns(self.timestamp_ns)
 
 
 # =============================================================================
@@ -153,6 +190,8 @@ class TimelineEvent(BaseModel):
     The timeline is the primary diagnostic artifact - it answers
     "What happened before, during, and after the failure?"
     """
+    model_config = FROZEN
+    
     event_id: str
     timestamp: datetime
     event_type: TimelineEventType
@@ -185,8 +224,8 @@ class Incident(BaseModel):
     metrics_snapshot: Dict[str, Any] = Field(default_factory=dict)
     
     # Timeline: the primary diagnostic artifact
-    # Bounded to last ~50 events to prevent memory issues
-    timeline: List[TimelineEvent] = Field(default_factory=list)
+    # Bounded to last ~50 events to prevent memory issues (deque drops oldest)
+    timeline: Deque[TimelineEvent] = Field(default_factory=lambda: deque(maxlen=50))
 
 
 # =============================================================================
@@ -195,6 +234,8 @@ class Incident(BaseModel):
 
 class StreamSummary(BaseModel):
     """Stream summary for list view."""
+    model_config = FROZEN
+    
     id: str
     name: str
     status: StreamStatus
@@ -206,6 +247,8 @@ class StreamSummary(BaseModel):
 
 class StreamDetails(BaseModel):
     """Full stream details for investigation view."""
+    model_config = FROZEN
+    
     id: str
     name: str
     manifest_url: str
@@ -10,11 +10,14 @@ Thresholds are intentionally simple and tunable.
 """
 
 import logging
-from typing import Tuple, List, Optional
+from typing import Tuple, Optional
 from app.models import HealthState, RootCause, RootCauseConfidence
 
 logger = logging.getLogger(__name__)
 
+# Enum members bound once at module level (one global load, no attribute lookup)
+_GREEN, _YELLOW, _RED = HealthState.GREEN, HealthState.YELLOW, HealthState.RED
+
 
 # =============================================================================
 # THRESHOLDS (Tunable constants for interview discussion)
@@ -38,22 +41,80 @@ class HealthThresholds:
     YELLOW_DOWNLOAD_RATIO = 0.8  # Downloads slower than realtime
 
 
+# =============================================================================
+# ROOT CAUSE RULES (priority order - first match wins)
+# =============================================================================
+
+# Each rule: (predicate, label, confidence, evidence builder).
+# Predicates and evidence take (errors, ttfb, ratio, manifest_errors, consecutive).
+# Thresholds are bound as default args (locals) rather than looked up per call.
+# Order is semantic: earlier rules are more specific diagnoses.
+_ROOT_CAUSE_RULES = (
+    (
+        lambda err, ttfb, ratio, man, con: man > 0,
+        "Origin/CDN Outage", RootCauseConfidence.HIGH,
+        lambda err, ttfb, ratio, man, con: [f"{man} manifest fetch failures"],
+    ),
+    (
+        lambda err, ttfb, ratio, man, con: con >= 3,
+        "Encoder/Packager Issue", RootCauseConfidence.MEDIUM,
+        lambda err, ttfb, ratio, man, con: [
+            f"{con} consecutive segment errors",
+            "Manifest accessible but segments failing",
+        ],
+    ),
+    (
+        lambda err, ttfb, ratio, man, con: ttfb > 800 and ratio < 0.7,
+        "Network Congestion", RootCauseConfidence.MEDIUM,
+        lambda err, ttfb, ratio, man, con: [
+            f"High TTFB ({ttfb:.0f}ms)",
+            f"Low download ratio ({ratio:.2f}x)",
+        ],
+    ),
+    (
+        lambda err, ttfb, ratio, man, con, limit=HealthThresholds.YELLOW_TTFB_MS: ttfb > limit,
+        "CDN Edge Latency", RootCauseConfidence.LOW,
+        lambda err, ttfb, ratio, man, con, limit=HealthThresholds.YELLOW_TTFB_MS: [
+            f"Average TTFB {ttfb:.0f}ms exceeded {limit}ms threshold"
+        ],
+    ),
+    (
+        lambda err, ttfb, ratio, man, con, limit=HealthThresholds.YELLOW_DOWNLOAD_RATIO: ratio < limit,
+        "Bandwidth Constraint", RootCauseConfidence.LOW,
+        lambda err, ttfb, ratio, man, con: [f"Download ratio {ratio:.2f}x"],
+    ),
+    (
+        lambda err, ttfb, ratio, man, con: err > 0,
+        "Intermittent Issues", RootCauseConfidence.LOW,
+        lambda err, ttfb, ratio, man, con: [f"{err} errors in last 2 minutes"],
+    ),
+)
+
+
 # =============================================================================
 # HEALTH COMPUTATION
 # =============================================================================
 
-class HealthService:
+def _make_compute_health(thresholds):
     """
-    Derives health state from metrics.
+    Build compute_health with the thresholds baked in as default args.
     
-    Simple, deterministic, explainable.
+    Default args are plain locals inside the function, so the hot path
+    never touches HealthThresholds. Rebuild (call again) if thresholds
+    change at runtime.
     """
-    
     def compute_health(
         self,
         error_count_2min: int,
         avg_ttfb_ms: float,
-        avg_download_ratio: float
+        avg_download_ratio: float,
+        *,
+        red_errors=thresholds.RED_ERROR_COUNT,
+        red_ttfb=thresholds.RED_TTFB_MS,
+        red_ratio=thresholds.RED_DOWNLOAD_RATIO,
+        yellow_errors=thresholds.YELLOW_ERROR_COUNT,
+        yellow_ttfb=thresholds.YELLOW_TTFB_MS,
+        yellow_ratio=thresholds.YELLOW_DOWNLOAD_RATIO
     ) -> Tuple[HealthState, str]:
         """
         Compute health state and reason.
@@ -66,37 +127,42 @@ class HealthService:
             (YELLOW, "Average TTFB 650ms exceeds 500ms threshold")
             (GREEN, "Stream healthy")
         """
+        # Fast path: the steady-state healthy stream needs no reason list.
+        # Cheapest check (int compare) first.
+        if (error_count_2min < yellow_errors
+                and avg_ttfb_ms <= yellow_ttfb
+                and avg_download_ratio >= yellow_ratio):
+            return _GREEN, "Stream healthy"
+        
         reasons = []
-        state = HealthState.GREEN
+        state = _GREEN
         
         # Check for RED conditions (any one triggers RED)
-        if error_count_2min >= HealthThresholds.RED_ERROR_COUNT:
-            state = HealthState.RED
+        if error_count_2min >= red_errors:
+            state = _RED
             reasons.append(f"{error_count_2min} segment errors in last 2 minutes")
         
-        if avg_ttfb_ms > HealthThresholds.RED_TTFB_MS:
-            state = HealthState.RED
-            reasons.append(f"Average TTFB {avg_ttfb_ms:.0f}ms exceeded {HealthThresholds.RED_TTFB_MS}ms threshold (last 2 min)")
+        if avg_ttfb_ms > red_ttfb:
+            state = _RED
+            reasons.append(f"Average TTFB {avg_ttfb_ms:.0f}ms exceeded {red_ttfb}ms threshold (last 2 min)")
         
-        if avg_download_ratio < HealthThresholds.RED_DOWNLOAD_RATIO:
-            state = HealthState.RED
-            ratio_str = f"{avg_download_ratio:.2f}x"
-            reasons.append(f"Download ratio {ratio_str} fell below {HealthThresholds.RED_DOWNLOAD_RATIO}x threshold")
+        if avg_download_ratio < red_ratio:
+            state = _RED
+            reasons.append(f"Download ratio {avg_download_ratio:.2f}x fell below {red_ratio}x threshold")
         
         # If not RED, check for YELLOW conditions
-        if state == HealthState.GREEN:
-            if error_count_2min >= HealthThresholds.YELLOW_ERROR_COUNT:
-                state = HealthState.YELLOW
+        if state == _GREEN:
+            if error_count_2min >= yellow_errors:
+                state = _YELLOW
                 reasons.append(f"{error_count_2min} segment error(s) in last 2 minutes")
             
-            if avg_ttfb_ms > HealthThresholds.YELLOW_TTFB_MS:
-                state = HealthState.YELLOW
-                reasons.append(f"Average TTFB {avg_ttfb_ms:.0f}ms exceeded {HealthThresholds.YELLOW_TTFB_MS}ms threshold (last 2 min)")
+            if avg_ttfb_ms > yellow_ttfb:
+                state = _YELLOW
+                reasons.append(f"Average TTFB {avg_ttfb_ms:.0f}ms exceeded {yellow_ttfb}ms threshold (last 2 min)")
             
-            if avg_download_ratio < HealthThresholds.YELLOW_DOWNLOAD_RATIO:
-                state = HealthState.YELLOW
-                ratio_str = f"{avg_download_ratio:.2f}x"
-                reasons.append(f"Download ratio {ratio_str} fell below {HealthThresholds.YELLOW_DOWNLOAD_RATIO}x threshold")
+            if avg_download_ratio < yellow_ratio:
+                state = _YELLOW
+                reasons.append(f"Download ratio {avg_download_ratio:.2f}x fell below {yellow_ratio}x threshold")
         
         # Build reason string
         if reasons:
@@ -106,6 +172,18 @@ class HealthService:
         
         return state, reason
     
+    return compute_health
+
+
+class HealthService:
+    """
+    Derives health state from metrics.
+    
+    Simple, deterministic, explainable.
+    """
+    
+    compute_health = _make_compute_health(HealthThresholds)
+    
     def classify_root_cause(
         self,
         error_count_2min: int,
@@ -119,69 +197,21 @@ class HealthService:
         
         NO ML. Fully explainable. Every classification has clear evidence.
         
-        Classification rules (in priority order):
+        Classification rules (in priority order, see _ROOT_CAUSE_RULES):
         1. Manifest unreachable → Origin/CDN Outage (HIGH confidence)
         2. Manifest OK + many segment 404s → Encoder/Packager Issue (MEDIUM)
         3. High TTFB + low ratio → Network Congestion (MEDIUM)
         4. Moderate issues → Intermittent Issues (LOW)
         """
-        evidence: List[str] = []
-        
-        # Rule 1: Manifest errors → Origin/CDN Outage
-        if manifest_errors > 0:
-            evidence.append(f"{manifest_errors} manifest fetch failures")
-            return RootCause(
-                label="Origin/CDN Outage",
-                confidence=RootCauseConfidence.HIGH,
-                evidence=evidence
-            )
-        
-        # Rule 2: Consecutive segment errors → Encoder/Packager Issue
-        if consecutive_segment_errors >= 3:
-            evidence.append(f"{consecutive_segment_errors} consecutive segment errors")
-            evidence.append("Manifest accessible but segments failing")
-            return RootCause(
-                label="Encoder/Packager Issue",
-                confidence=RootCauseConfidence.MEDIUM,
-                evidence=evidence
-            )
-        
-        # Rule 3: High TTFB + low download ratio → Network Congestion
-        if avg_ttfb_ms > 800 and avg_download_ratio < 0.7:
-            evidence.append(f"High TTFB ({avg_ttfb_ms:.0f}ms)")
-            evidence.append(f"Low download ratio ({avg_download_ratio:.2f}x)")
-            return RootCause(
-                label="Network Congestion",
-                confidence=RootCauseConfidence.MEDIUM,
-                evidence=evidence
-            )
-        
-        # Rule 4: Just high TTFB → CDN Edge Latency
-        if avg_ttfb_ms > HealthThresholds.YELLOW_TTFB_MS:
-            evidence.append(f"Average TTFB {avg_ttfb_ms:.0f}ms exceeded {HealthThresholds.YELLOW_TTFB_MS}ms threshold")
-            return RootCause(
-                label="CDN Edge Latency",
-                confidence=RootCauseConfidence.LOW,
-                evidence=evidence
-            )
-        
-        # Rule 5: Just slow downloads → Bandwidth Constraint
-        if avg_download_ratio < HealthThresholds.YELLOW_DOWNLOAD_RATIO:
-            evidence.append(f"Download ratio {avg_download_ratio:.2f}x")
-            return RootCause(
-                label="Bandwidth Constraint",
-                confidence=RootCauseConfidence.LOW,
-                evidence=evidence
-            )
-        
-        # Rule 6: Segment errors but not patterned → Intermittent Issues
-        if error_count_2min > 0:
-            evidence.append(f"{error_count_2min} errors in last 2 minutes")
-            return RootCause(
-                label="Intermittent Issues",
-                confidence=RootCauseConfidence.LOW,
-                evidence=evidence
-            )
+        args = (error_count_2min, avg_ttfb_ms, avg_download_ratio,
+                manifest_errors, consecutive_segment_errors)
+        for predicate, label, confidence, build_evidence in _ROOT_CAUSE_RULES:
+            if predicate(*args):
+                return RootCause(
+                    label=label,
+                    confidence=confidence,
+                    evidence=build_evidence(*args)
+                )
         
         return None  # No issues detected
     
@@ -205,11 +235,11 @@ class HealthService:
         YELLOW_THRESHOLD_SECONDS = 120  # 2 minutes
         
         # Direct transition to RED
-        if current_state == HealthState.RED and previous_state != HealthState.RED:
+        if current_state == _RED and previous_state != _RED:
             return True, f"Health degraded from {previous_state.value.upper()} to RED"
         
         # Prolonged YELLOW
-        if current_state == HealthState.YELLOW and yellow_duration_seconds > YELLOW_THRESHOLD_SECONDS:
+        if current_state == _YELLOW and yellow_duration_seconds > YELLOW_THRESHOLD_SECONDS:
             return True, f"Stream degraded (YELLOW) for over {YELLOW_THRESHOLD_SECONDS // 60} minutes"
         
         return False, ""
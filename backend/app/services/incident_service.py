@@ -10,11 +10,17 @@ Design philosophy:
 Key insight: Operators don't need more metrics, they need faster diagnosis.
 """
 
+import heapq
 import logging
-import uuid
+import secrets
+from operator import attrgetter
+from collections import deque
+from itertools import count, islice
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import orjson
+
 from app.models import (
     Incident, IncidentStatus, TimelineEvent, TimelineEventType,
     HealthState, StreamHealth
@@ -22,6 +28,16 @@ from app.models import (
 
 logger = logging.getLogger(__name__)
 
+_started_at = attrgetter("started_at")
+
+# Enum members bound once at module level (one global load, no attribute lookup)
+_OPEN = IncidentStatus.OPEN
+_ACKNOWLEDGED = IncidentStatus.ACKNOWLEDGED
+_RESOLVED = IncidentStatus.RESOLVED
+_TE_OPENED = TimelineEventType.INCIDENT_OPENED
+_TE_ACKNOWLEDGED = TimelineEventType.INCIDENT_ACKNOWLEDGED
+_TE_RESOLVED = TimelineEventType.INCIDENT_RESOLVED
+
 
 # =============================================================================
 # INCIDENT LIFECYCLE MANAGEMENT
@@ -44,65 +60,89 @@ class IncidentService:
         # stream_id -> Incident (only one active per stream)
         self.active_incidents: Dict[str, Incident] = {}
         
-        # Bounded history of resolved incidents
-        self.incident_history: List[Incident] = []
+        # Bounded history of resolved incidents: incident_id -> Incident in
+        # resolution order (oldest first). A dict rather than a deque so a
+        # stream's entries can be dropped by key on cleanup without a scan.
+        self.incident_history: Dict[str, Incident] = {}
+        
+        # stream_id -> that stream's incidents (active + retained history),
+        # so stream-filtered queries don't scan everything
+        self.incidents_by_stream: Dict[str, List[Incident]] = {}
+        
+        # incident_id -> Incident (active + retained history)
+        self.by_id: Dict[str, Incident] = {}
+        
+        # stream_id -> serialized active timeline, rebuilt lazily after appends
+        self._timeline_json: Dict[str, bytes] = {}
+        
+        # IDs: per-process random prefix + counter (unique across restarts,
+        # no CSPRNG call per timeline event)
+        self._id_prefix = secrets.token_hex(2)
+        self._id_counter = count(1)
     
     def _generate_id(self) -> str:
         """Generate unique incident/event ID."""
-        return str(uuid.uuid4())[:8]
+        return f"{self._id_prefix}{next(self._id_counter):06x}"
     
     def get_active_incident(self, stream_id: str) -> Optional[Incident]:
         """Get the active incident for a stream, if any."""
         return self.active_incidents.get(stream_id)
     
+    def has_active_incident(self, stream_id: str) -> bool:
+        """Cheap guard so callers can skip building timeline events."""
+        return stream_id in self.active_incidents
+    
     def get_incident_by_id(self, incident_id: str) -> Optional[Incident]:
         """Find incident by ID (active or historical)."""
-        # Check active incidents
-        for incident in self.active_incidents.values():
-            if incident.incident_id == incident_id:
-                return incident
-        
-        # Check history
-        for incident in self.incident_history:
-            if incident.incident_id == incident_id:
-                return incident
-        
-        return None
+        return self.by_id.get(incident_id)
     
     def get_all_incidents(
         self,
         stream_id: Optional[str] = None,
         active_only: bool = True
     ) -> List[Incident]:
-        """Get incidents, optionally filtered."""
-        if active_only:
-            incidents = list(self.active_incidents.values())
-        else:
-            incidents = list(self.active_incidents.values()) + self.incident_history
+        """
+        Get incidents newest first, optionally filtered (index lookups, no sort
+        of the full set).
         
+        Each per-stream list is appended at creation, so it is already in
+        started_at order; the unfiltered view is a k-way merge of those lists.
+        """
         if stream_id:
-            incidents = [i for i in incidents if i.stream_id == stream_id]
+            if active_only:
+                active = self.active_incidents.get(stream_id)
+                return [active] if active else []
+            return list(reversed(self.incidents_by_stream.get(stream_id, ())))
         
-        # Sort by started_at, newest first
-        incidents.sort(key=lambda i: i.started_at, reverse=True)
-        return incidents
+        if active_only:
+            # At most one per stream - a small sort
+            return sorted(self.active_incidents.values(), key=_started_at, reverse=True)
+        
+        return list(heapq.merge(
+            *(reversed(incidents) for incidents in self.incidents_by_stream.values()),
+            key=_started_at,
+            reverse=True
+        ))
     
     def create_incident(
         self,
         stream_id: str,
         trigger_reason: str,
-        health: StreamHealth
+        health: StreamHealth,
+        now: Optional[datetime] = None
     ) -> Incident:
         """
         Create a new incident for a stream.
         
         Precondition: No active incident exists for this stream.
         """
-        if stream_id in self.active_incidents:
+        existing = self.active_incidents.get(stream_id)
+        if existing is not None:
             logger.warning(f"Attempted to create incident but one already exists for {stream_id}")
-            return self.active_incidents[stream_id]
+            return existing
         
-        now = datetime.utcnow()
+        if now is None:
+            now = datetime.utcnow()
         incident_id = f"INC-{self._generate_id()}"
         
         # Create metrics snapshot for diagnosis
@@ -115,26 +155,31 @@ class IncidentService:
             "captured_at": now.isoformat()
         }
         
-        # Initial timeline event
-        initial_event = TimelineEvent(
+        # Initial timeline event. Built with model_construct (all values are
+        # ours and already typed) so the event metadata and the incident's
+        # metrics_snapshot stay the same dict - validation would copy it.
+        initial_event = TimelineEvent.model_construct(
             event_id=self._generate_id(),
             timestamp=now,
-            event_type=TimelineEventType.INCIDENT_OPENED,
+            event_type=_TE_OPENED,
             message=trigger_reason,
             metadata=metrics_snapshot
         )
         
-        incident = Incident(
+        incident = Incident.model_construct(
             incident_id=incident_id,
             stream_id=stream_id,
-            status=IncidentStatus.OPEN,
+            status=_OPEN,
             trigger_reason=trigger_reason,
             started_at=now,
             metrics_snapshot=metrics_snapshot,
-            timeline=[initial_event]
+            timeline=deque([initial_event], maxlen=self.MAX_TIMELINE_EVENTS)
         )
         
         self.active_incidents[stream_id] = incident
+        self.incidents_by_stream.setdefault(stream_id, []).append(incident)
+        self.by_id[incident_id] = incident
+        self._timeline_json.pop(stream_id, None)
         logger.info(f"Created incident {incident_id} for stream {stream_id}: {trigger_reason}")
         
         return incident
@@ -145,7 +190,8 @@ class IncidentService:
         event_type: TimelineEventType,
         message: str,
         metadata: Optional[Dict] = None,
-        thumbnail_url: Optional[str] = None
+        thumbnail_url: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> Optional[TimelineEvent]:
         """
         Add an event to the active incident's timeline.
@@ -158,46 +204,84 @@ class IncidentService:
         
         event = TimelineEvent(
             event_id=self._generate_id(),
-            timestamp=datetime.utcnow(),
+            timestamp=now or datetime.utcnow(),
             event_type=event_type,
             message=message,
             metadata=metadata or {},
             thumbnail_url=thumbnail_url
         )
         
+        # Bounded deque: oldest event falls off in O(1)
         incident.timeline.append(event)
-        
-        # Bound timeline size
-        if len(incident.timeline) > self.MAX_TIMELINE_EVENTS:
-            incident.timeline = incident.timeline[-self.MAX_TIMELINE_EVENTS:]
+        self._timeline_json.pop(stream_id, None)
         
         return event
     
-    def acknowledge_incident(self, incident_id: str) -> Optional[Incident]:
+    def get_timeline_tail(self, stream_id: str, limit: int) -> List[TimelineEvent]:
+        """Last `limit` events of the active incident's timeline (oldest first)."""
+        incident = self.active_incidents.get(stream_id)
+        if not incident:
+            return []
+        timeline = incident.timeline
+        return list(islice(timeline, max(0, len(timeline) - limit), None))
+    
+    def get_timeline_json(self, stream_id: str, limit: int) -> bytes:
+        """
+        Serialized timeline tail for the API.
+        
+        The full timeline (<= MAX_TIMELINE_EVENTS) is encoded once per
+        change and reused by every poll; only smaller limits re-encode.
+        """
+        incident = self.active_incidents.get(stream_id)
+        if not incident:
+            return b"[]"
+        
+        if limit < len(incident.timeline):
+            return orjson.dumps([
+                e.model_dump(mode='json')
+                for e in self.get_timeline_tail(stream_id, limit)
+            ])
+        
+        cached = self._timeline_json.get(stream_id)
+        if cached is None:
+            cached = orjson.dumps([e.model_dump(mode='json') for e in incident.timeline])
+            self._timeline_json[stream_id] = cached
+        return cached
+    
+    def acknowledge_incident(self, incident_id: str, now: Optional[datetime] = None) -> Optional[Incident]:
         """
         Acknowledge an incident (operator saw it, investigating).
         
         Returns the updated incident or None if not found.
         """
-        for stream_id, incident in self.active_incidents.items():
-            if incident.incident_id == incident_id:
-                if incident.status == IncidentStatus.OPEN:
-                    incident.status = IncidentStatus.ACKNOWLEDGED
-                    incident.acknowledged_at = datetime.utcnow()
-                    
-                    self.add_timeline_event(
-                        stream_id,
-                        TimelineEventType.INCIDENT_ACKNOWLEDGED,
-                        "Incident acknowledged by operator"
-                    )
-                    
-                    logger.info(f"Incident {incident_id} acknowledged")
-                
-                return incident
-        
-        return None
-    
-    def resolve_incident(self, stream_id: str, reason: str = "Health returned to GREEN") -> Optional[Incident]:
+        incident = self.by_id.get(incident_id)
+        # Only active incidents can be acknowledged (history is read-only)
+        if incident is None or self.active_incidents.get(incident.stream_id) is not incident:
+            return None
+        
+        if incident.status == _OPEN:
+            if now is None:
+                now = datetime.utcnow()
+            incident.status = _ACKNOWLEDGED
+            incident.acknowledged_at = now
+            
+            self.add_timeline_event(
+                incident.stream_id,
+                _TE_ACKNOWLEDGED,
+                "Incident acknowledged by operator",
+                now=now
+            )
+            
+            logger.info(f"Incident {incident_id} acknowledged")
+        
+        return incident
+    
+    def resolve_incident(
+        self,
+        stream_id: str,
+        reason: str = "Health returned to GREEN",
+        now: Optional[datetime] = None
+    ) -> Optional[Incident]:
         """
         Resolve an active incident (health recovered).
         
@@ -207,39 +291,53 @@ class IncidentService:
         if not incident:
             return None
         
-        now = datetime.utcnow()
-        incident.status = IncidentStatus.RESOLVED
+        if now is None:
+            now = datetime.utcnow()
+        incident.status = _RESOLVED
         incident.resolved_at = now
         
         # Add resolution event
         self.add_timeline_event(
             stream_id,
-            TimelineEventType.INCIDENT_RESOLVED,
-            reason
+            _TE_RESOLVED,
+            reason,
+            now=now
         )
         
         # Move to history
         del self.active_incidents[stream_id]
-        self.incident_history.append(incident)
+        self._timeline_json.pop(stream_id, None)
         
-        # Bound history size
-        if len(self.incident_history) > self.MAX_HISTORY:
-            self.incident_history = self.incident_history[-self.MAX_HISTORY:]
+        # Bound history size: evict the oldest (first inserted) entry
+        if len(self.incident_history) >= self.MAX_HISTORY:
+            oldest_id = next(iter(self.incident_history))
+            self._unindex(self.incident_history.pop(oldest_id))
+        self.incident_history[incident.incident_id] = incident
         
         logger.info(f"Incident {incident.incident_id} resolved: {reason}")
         
         return incident
     
+    def _unindex(self, incident: Incident):
+        """Remove an evicted incident from the id and per-stream indexes."""
+        self.by_id.pop(incident.incident_id, None)
+        stream_incidents = self.incidents_by_stream.get(incident.stream_id)
+        if stream_incidents is None:
+            return
+        stream_incidents[:] = [i for i in stream_incidents if i is not incident]
+        if not stream_incidents:
+            del self.incidents_by_stream[incident.stream_id]
+    
     def cleanup_stream(self, stream_id: str):
         """Remove all incident data for a stream (called on stream removal)."""
-        if stream_id in self.active_incidents:
-            del self.active_incidents[stream_id]
-        
-        # Also clean history for this stream
-        self.incident_history = [
-            i for i in self.incident_history 
-            if i.stream_id != stream_id
-        ]
+        self.active_incidents.pop(stream_id, None)
+        self._timeline_json.pop(stream_id, None)
+        
+        # The per-stream index holds exactly this stream's incidents, so
+        # history cleanup is one pop per incident - no scan of all history
+        for incident in self.incidents_by_stream.pop(stream_id, ()):
+            self.by_id.pop(incident.incident_id, None)
+            self.incident_history.pop(incident.incident_id, None)
 
 
 # Global instance
@@ -21,20 +21,24 @@ Removed (intentionally - see implementation_plan.md):
 
 import asyncio
 import aiohttp
+import heapq
+import numpy as np
+import orjson
 import time
 import logging
 import re
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Set
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
-from collections import deque
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+from collections import OrderedDict, deque
+
+from pydantic import TypeAdapter
 
 from app.config import settings
 from app.models import (
     StreamConfig, SegmentMetrics, StreamHealth, StreamStatus,
-    HealthState, TimelineEventType, StreamSummary, StreamDetails
+    HealthState, TimelineEventType, StreamSummary, StreamDetails, from_epoch_ns
 )
 from app.services.health_service import health_service
 from app.services.incident_service import incident_service
@@ -43,6 +47,154 @@ from app.services.websocket_manager import ws_manager
 
 logger = logging.getLogger(__name__)
 
+# Built once: serializes the list view in pydantic-core without per-call introspection
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[StreamSummary])
+
+
+def _same_list_view(old: Optional[StreamSummary], new: StreamSummary) -> bool:
+    """
+    True if two summaries differ at most in health.last_updated.
+    
+    That stamp moves on every health tick, so counting it as a change
+    would bump the list ETag on every tick of every stream.
+    """
+    if old is None:
+        return False
+    if old.health is not new.health:
+        old_health, new_health = old.health.__dict__, new.health.__dict__
+        for field, value in old_health.items():
+            if field != "last_updated" and value != new_health[field]:
+                return False
+    new_fields = new.__dict__
+    return all(
+        value == new_fields[field]
+        for field, value in old.__dict__.items() if field != "health"
+    )
+
+# Built once instead of per request. Segment timeout is the session default;
+# manifests override with a tighter total.
+_SEGMENT_TIMEOUT = aiohttp.ClientTimeout(total=settings.DOWNLOAD_TIMEOUT, sock_connect=5)
+_MANIFEST_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=5)
+
+# Health state -> list/detail status (RED is the only non-ONLINE state)
+_STATE_TO_STATUS = {
+    HealthState.GREEN: StreamStatus.ONLINE,
+    HealthState.YELLOW: StreamStatus.ONLINE,
+    HealthState.RED: StreamStatus.ERROR,
+}
+
+# Returned by _fetch_manifest on 304 Not Modified
+_MANIFEST_UNCHANGED = object()
+
+# Manifest parsing: a tag line followed by its URI line (URI lines never
+# start with '#'). Compiled once at import.
+_VARIANT_RE = re.compile(r'^[ \t]*#EXT-X-STREAM-INF:([^\n]*)\n[ \t]*([^\s#][^\n]*?)[ \t\r]*$', re.M)
+_SEGMENT_RE = re.compile(r'^[ \t]*#EXTINF:[ \t]*([\d.]*)[^\n]*\n[ \t]*([^\s#][^\n]*?)[ \t\r]*$', re.M)
+_BANDWIDTH_RE = re.compile(r'BANDWIDTH=(\d+)')
+_RESOLUTION_RE = re.compile(r'RESOLUTION=(\d+x\d+)')
+
+
+@lru_cache(maxsize=256)
+def _url_base(base_url: str) -> Tuple[str, str]:
+    """(origin, directory prefix) of a manifest URL, computed once per URL."""
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    return origin, origin + parts.path.rsplit('/', 1)[0] + '/'
+
+
+# Already-absolute URI urljoin would return untouched: lowercase scheme
+# (urljoin lowercases it) and a host at the very start - not "://" inside a query
+_ABSOLUTE_URI_RE = re.compile(r'[a-z][a-z0-9+.\-]*://[^/?#]')
+
+
+def _resolve_uri(base_url: str, uri: str) -> str:
+    """
+    urljoin() with string-concat fast paths for the common manifest URIs.
+    
+    Plain relative names ("seg123.ts", "720p/index.m3u8") and root-relative
+    paths are joined directly; anything urljoin would normalize or parse
+    differently (dot segments, empty path segments, fragments, empty query,
+    ';' params, any other colon, surrounding whitespace / control chars)
+    goes through urljoin.
+    """
+    if (not uri or '/.' in uri or '#' in uri or uri[-1] == '?'
+            or uri[0] <= ' ' or uri[-1] <= ' ' or not uri.isprintable()):
+        return urljoin(base_url, uri)
+    absolute = _ABSOLUTE_URI_RE.match(uri)
+    if absolute:
+        return uri if '//' not in uri[absolute.end():] else urljoin(base_url, uri)
+    if uri[0] in '.?' or '//' in uri or ':' in uri or ';' in uri:
+        return urljoin(base_url, uri)
+    origin, base_dir = _url_base(base_url)
+    return origin + uri if uri[0] == '/' else base_dir + uri
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """EXTINF duration attribute -> seconds (None if missing/invalid)."""
+    try:
+        duration = float(value)
+    except ValueError:
+        return None
+    return duration if duration > 0 else None
+
+
+# =============================================================================
+# MPEG-TS DURATION (fallback when the manifest has no usable EXTINF)
+# =============================================================================
+
+TS_PACKET_SIZE = 188
+TS_SYNC_BYTE = 0x47
+PCR_CLOCK_HZ = 27_000_000
+PCR_SCAN_PACKETS = 2000  # PCR repeats every <=100ms, so this is plenty
+
+
+def _packet_pcr(data: bytes, offset: int) -> Optional[int]:
+    """27 MHz PCR of the TS packet at offset, or None if it carries none."""
+    if data[offset] != TS_SYNC_BYTE or not (data[offset + 3] & 0x20):
+        return None  # no sync / no adaptation field
+    if data[offset + 4] < 7 or not (data[offset + 5] & 0x10):
+        return None  # adaptation field too short / PCR flag unset
+    b = data[offset + 6:offset + 12]
+    base = (b[0] << 25) | (b[1] << 17) | (b[2] << 9) | (b[3] << 1) | (b[4] >> 7)
+    extension = ((b[4] & 0x01) << 8) | b[5]
+    return base * 300 + extension
+
+
+def _ts_pcr_duration(data: bytes) -> Optional[float]:
+    """
+    Segment duration (seconds) from the first and last PCR, in memory.
+    
+    Approximate (one PCR interval short), but no subprocess and no disk.
+    """
+    start = data.find(bytes([TS_SYNC_BYTE]))
+    if start < 0:
+        return None
+    last_offset = start + ((len(data) - start) // TS_PACKET_SIZE - 1) * TS_PACKET_SIZE
+    if last_offset <= start:
+        return None
+    
+    first_pcr = None
+    for k in range(PCR_SCAN_PACKETS):
+        offset = start + k * TS_PACKET_SIZE
+        if offset > last_offset:
+            break
+        first_pcr = _packet_pcr(data, offset)
+        if first_pcr is not None:
+            break
+    if first_pcr is None:
+        return None
+    
+    for k in range(PCR_SCAN_PACKETS):
+        offset = last_offset - k * TS_PACKET_SIZE
+        if offset < start:
+            break
+        last_pcr = _packet_pcr(data, offset)
+        if last_pcr is not None:
+            if last_pcr <= first_pcr:
+                return None  # single PCR or wrapped clock
+            return (last_pcr - first_pcr) / PCR_CLOCK_HZ
+    return None
+
 
 # =============================================================================
 # ROLLING WINDOW FOR METRICS (Last 2 minutes)
@@ -54,38 +206,205 @@ class MetricsWindow:
     
     Design: Keep last 2 minutes of metrics for health assessment.
     Bounded to prevent memory growth.
+    
+    Stored as parallel fixed-size NumPy columns (ring buffer). Error count
+    and TTFB/ratio sums are kept as running totals (subtract-on-evict), so
+    a health tick is O(expired entries) rather than a pass over the window.
+    Sums are recomputed exactly once per ring wrap to bound float drift.
+    Peak TTFB / lowest ratio use monotonic deques of (value, seq), which
+    are amortized O(1) per add/evict.
     """
     MAX_AGE_SECONDS = 120  # 2 minutes
+    MAX_AGE_NS = MAX_AGE_SECONDS * 1_000_000_000
     MAX_ITEMS = 60  # ~60 segments in 2 min at 2s segments
     
     def __init__(self):
-        self.metrics: deque = deque(maxlen=self.MAX_ITEMS)
+        self.ts = np.zeros(self.MAX_ITEMS, dtype=np.int64)  # epoch ns, 0 = empty slot
+        self.ttfb = np.zeros(self.MAX_ITEMS, dtype=np.float64)
+        self.ratio = np.zeros(self.MAX_ITEMS, dtype=np.float64)
+        self.is_err = np.zeros(self.MAX_ITEMS, dtype=np.bool_)
+        # Original objects kept per slot only for get_recent()
+        self._items: List[Optional[SegmentMetrics]] = [None] * self.MAX_ITEMS
+        self.head = 0   # next slot to write
+        self.count = 0  # live entries; oldest is at (head - count) % MAX_ITEMS
+        
+        # Running aggregates over the live entries
+        self._count_err = 0
+        self._sum_ttfb = 0.0
+        self._sum_ratio = 0.0
+        
+        # Sliding max TTFB / min ratio over successful segments.
+        # seq is the add() counter; the oldest live entry is _seq - count.
+        self._seq = 0
+        self._max_ttfb: deque = deque()
+        self._min_ratio: deque = deque()
     
     def add(self, metric: SegmentMetrics):
-        self.metrics.append(metric)
+        if self.count == self.MAX_ITEMS:
+            self._evict_oldest()
+        
+        i = self.head
+        self.ts[i] = metric.timestamp_ns
+        self.ttfb[i] = metric.ttfb
+        self.ratio[i] = metric.download_ratio
+        self.is_err[i] = metric.is_error
+        self._items[i] = metric
+        if metric.is_error:
+            self._count_err += 1
+        else:
+            self._sum_ttfb += metric.ttfb
+            self._sum_ratio += metric.download_ratio
+            
+            max_ttfb = self._max_ttfb
+            while max_ttfb and max_ttfb[-1][0] <= metric.ttfb:
+                max_ttfb.pop()
+            max_ttfb.append((metric.ttfb, self._seq))
+            
+            min_ratio = self._min_ratio
+            while min_ratio and min_ratio[-1][0] >= metric.download_ratio:
+                min_ratio.pop()
+            min_ratio.append((metric.download_ratio, self._seq))
+        
+        self._seq += 1
+        self.head = (i + 1) % self.MAX_ITEMS
+        self.count += 1
+        if self.head == 0:
+            self._resync()
+    
+    def _evict_oldest(self):
+        """Drop the oldest live entry, subtracting it from the aggregates."""
+        i = (self.head - self.count) % self.MAX_ITEMS
+        evicted_seq = self._seq - self.count
+        if self._max_ttfb and self._max_ttfb[0][1] == evicted_seq:
+            self._max_ttfb.popleft()
+        if self._min_ratio and self._min_ratio[0][1] == evicted_seq:
+            self._min_ratio.popleft()
+        if self.is_err[i]:
+            self._count_err -= 1
+        else:
+            self._sum_ttfb -= self.ttfb[i]
+            self._sum_ratio -= self.ratio[i]
+        self.ts[i] = 0
+        self._items[i] = None
+        self.count -= 1
+        if not self.count:
+            self._count_err = 0
+            self._sum_ttfb = 0.0
+            self._sum_ratio = 0.0
+    
+    def _evict_expired(self, now_ns: Optional[int] = None):
+        """Drop entries older than the window (timestamps are append-ordered)."""
+        cutoff_ns = self._cutoff_ns(now_ns)
+        ts = self.ts
+        while self.count and ts[(self.head - self.count) % self.MAX_ITEMS] <= cutoff_ns:
+            self._evict_oldest()
+    
+    def _resync(self):
+        """Recompute the aggregates exactly from the live slots."""
+        live = self.ts > 0
+        ok = live & ~self.is_err
+        err = np.count_nonzero(live & self.is_err)
+        sum_ttfb = self.ttfb[ok].sum()
+        sum_ratio = self.ratio[ok].sum()
+        self._count_err = int(err)
+        self._sum_ttfb = float(sum_ttfb)
+        self._sum_ratio = float(sum_ratio)
+    
+    def _cutoff_ns(self, now_ns: Optional[int] = None) -> int:
+        """Window start as one int (no datetime/timedelta per call)."""
+        return (now_ns if now_ns is not None else time.time_ns()) - self.MAX_AGE_NS
+    
+    def snapshot(self, now_ns: Optional[int] = None) -> Tuple[int, float, float]:
+        """
+        All three health inputs in one call (O(1) after expiring old entries).
+        
+        Returns:
+            (error_count, avg_ttfb_ms, avg_download_ratio)
+        """
+        self._evict_expired(now_ns)
+        ok = self.count - self._count_err
+        if not ok:
+            return self._count_err, 0.0, 1.0
+        return self._count_err, float(self._sum_ttfb / ok), float(self._sum_ratio / ok)
+    
+    def get_recent(self, now_ns: Optional[int] = None) -> List[SegmentMetrics]:
+        """Get metrics from last 2 minutes (oldest first)."""
+        self._evict_expired(now_ns)
+        start = self.head - self.count
+        return [self._items[(start + k) % self.MAX_ITEMS] for k in range(self.count)]
     
-    def get_recent(self) -> List[SegmentMetrics]:
-        """Get metrics from last 2 minutes."""
-        cutoff = datetime.utcnow() - timedelta(seconds=self.MAX_AGE_SECONDS)
-        return [m for m in self.metrics if m.timestamp > cutoff]
+    def get_max_ttfb(self, now_ns: Optional[int] = None) -> float:
+        """Peak TTFB of successful segments in window (ms), 0.0 if none."""
+        self._evict_expired(now_ns)
+        return self._max_ttfb[0][0] if self._max_ttfb else 0.0
+    
+    def get_min_download_ratio(self, now_ns: Optional[int] = None) -> float:
+        """Lowest download ratio of successful segments in window, 1.0 if none."""
+        self._evict_expired(now_ns)
+        return self._min_ratio[0][0] if self._min_ratio else 1.0
     
     def get_error_count(self) -> int:
         """Count errors in window."""
-        return sum(1 for m in self.get_recent() if m.is_error)
+        return self.snapshot()[0]
     
     def get_avg_ttfb(self) -> float:
         """Average TTFB in window (ms)."""
-        recent = [m for m in self.get_recent() if not m.is_error]
-        if not recent:
-            return 0.0
-        return sum(m.ttfb for m in recent) / len(recent)
+        return self.snapshot()[1]
     
     def get_avg_download_ratio(self) -> float:
         """Average download ratio in window."""
-        recent = [m for m in self.get_recent() if not m.is_error]
-        if not recent:
-            return 1.0
-        return sum(m.download_ratio for m in recent) / len(recent)
+        return self.snapshot()[2]
+
+
+# =============================================================================
+# METRICS HISTORY RING (Analysis Mode charts, last ~60 minutes)
+# =============================================================================
+
+class MetricsRing:
+    """
+    Fixed-size ring of segment metrics stored as parallel NumPy arrays.
+    
+    Design: Analysis Mode needs range filtering and per-minute error
+    bucketing over up to an hour of points. Keeping the columns in
+    preallocated arrays lets that run as array ops (searchsorted,
+    unique) instead of a Python loop over SegmentMetrics objects.
+    """
+    CAPACITY = 1800  # ~60 min at 2s segments
+    
+    def __init__(self, capacity: int = CAPACITY):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)  # epoch ns
+        self.ttfb = np.zeros(capacity, dtype=np.float64)
+        self.download_ratio = np.zeros(capacity, dtype=np.float64)
+        self.is_error = np.zeros(capacity, dtype=np.bool_)
+        self.head = 0  # next slot to write
+        self.count = 0
+    
+    def add(self, metric: SegmentMetrics):
+        i = self.head
+        self.timestamps[i] = metric.timestamp_ns
+        self.ttfb[i] = metric.ttfb
+        self.download_ratio[i] = metric.download_ratio
+        self.is_error[i] = metric.is_error
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def since(self, cutoff_ns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get (timestamps, ttfb, download_ratio, is_error) newer than cutoff_ns.
+        
+        Arrays are in chronological order. Metrics are appended as they
+        are created, so timestamps are sorted and the cutoff is a binary search.
+        """
+        columns = (self.timestamps, self.ttfb, self.download_ratio, self.is_error)
+        if self.count < self.capacity:
+            columns = tuple(c[:self.count] for c in columns)
+        else:
+            columns = tuple(np.roll(c, -self.head) for c in columns)
+        
+        start = np.searchsorted(columns[0], cutoff_ns, side='right')
+        return tuple(c[start:] for c in columns)
 
 
 # =============================================================================
@@ -103,39 +422,84 @@ class StreamMonitor:
     4. Timeline tracking
     """
     
+    MAX_VARIANT_HOPS = 3  # master -> media playlist redirects followed per poll
+    ERROR_COALESCE_NS = 1_000_000_000  # repeats of one error within 1s share one timeline/broadcast
+    
     def __init__(self):
         self.active_streams: Dict[str, StreamConfig] = {}
+        # Manifest polling: one scheduler task over a heap of (due, stream_id);
+        # monitoring_tasks holds only the poll currently in flight per stream
         self.monitoring_tasks: Dict[str, asyncio.Task] = {}
-        self.seen_segments: Dict[str, Set[str]] = {}
+        self.poll_urls: Dict[str, str] = {}  # current playlist URL (variant once resolved)
+        self._schedule: List[Tuple[float, str]] = []
+        self._next_poll: Dict[str, float] = {}  # stream_id -> due time of its live heap entry
+        self._schedule_changed = asyncio.Event()
+        self._scheduler_task: Optional[asyncio.Task] = None
+        # Per-stream bounded segment queue + fixed worker pool (no task per segment)
+        self.segment_queues: Dict[str, asyncio.Queue] = {}
+        self.segment_workers: Dict[str, List[asyncio.Task]] = {}
+        # Recently seen segments in playlist order (an LRU "set": values unused).
+        # Bounded to ~2x the playlist window instead of growing for the stream's lifetime.
+        # Keys are hash(url) ints, not the URL strings (64-bit: collisions negligible).
+        self.seen_segments: Dict[str, OrderedDict] = {}
         self.current_metrics: Dict[str, SegmentMetrics] = {}
         self.metrics_windows: Dict[str, MetricsWindow] = {}
         self.health_states: Dict[str, StreamHealth] = {}
         self.previous_states: Dict[str, HealthState] = {}
-        self.yellow_start_times: Dict[str, datetime] = {}
+        self.yellow_start_times: Dict[str, float] = {}  # time.monotonic() at YELLOW entry
         self.segment_counters: Dict[str, int] = {}
         
         # Root cause tracking
         self.manifest_error_counts: Dict[str, int] = {}  # For origin outage detection
         self.consecutive_error_counts: Dict[str, int] = {}  # For encoder issue detection
+        # stream_id -> [message, last fan-out time_ns, repeats suppressed since]
+        self._error_bursts: Dict[str, list] = {}
+        # stream_id -> [playlist url, ETag, Last-Modified, hash(body)] of the last
+        # parsed playlist, so unchanged polls skip the parse and dedup pass
+        self._manifest_validators: Dict[str, list] = {}
         
         # Metrics history for Analysis Mode charts (last 60 min)
-        self.metrics_history: Dict[str, deque] = {}  # stream_id -> deque of (timestamp, ttfb, ratio, error_count)
-        self.health_history: Dict[str, deque] = {}  # stream_id -> deque of (timestamp, state)
+        self.metrics_history: Dict[str, MetricsRing] = {}
+        self.health_history: Dict[str, deque] = {}  # stream_id -> deque of (timestamp_ns, state) transitions
         self.HISTORY_MAX_ITEMS = 360  # ~60 min at 10s intervals
         
-        self.segments_dir = Path(settings.SEGMENTS_DIR)
-        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        # List-view snapshot: rebuilt when a stream's state changes, not per GET
+        self._summaries: Dict[str, StreamSummary] = {}
+        self._summaries_json: Optional[bytes] = None
+        # Bumped when the list view changes; boot id keeps ETags unique across restarts
+        self._summaries_version = 0
+        self._boot_id = f"{time.time_ns():x}"
+        
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def start(self):
         """Initialize the monitor."""
-        self.session = aiohttp.ClientSession()
+        # All streams poll the same few origins: one pooled keep-alive
+        # connector avoids a TCP/TLS handshake per manifest/segment fetch
+        connector = aiohttp.TCPConnector(
+            limit=0,  # bounded per host instead
+            limit_per_host=settings.MAX_CONN_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": f"{settings.APP_NAME}/{settings.APP_VERSION}"},
+            timeout=_SEGMENT_TIMEOUT,
+            trust_env=False
+        )
         logger.info("StreamMonitor started (simplified version)")
     
     async def stop(self):
         """Cleanup the monitor."""
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
         for task in self.monitoring_tasks.values():
             task.cancel()
+        for workers in self.segment_workers.values():
+            for worker in workers:
+                worker.cancel()
         
         if self.session:
             await self.session.close()
@@ -151,7 +515,7 @@ class StreamMonitor:
             return
         
         self.active_streams[stream_id] = stream_config
-        self.seen_segments[stream_id] = set()
+        self.seen_segments[stream_id] = OrderedDict()
         self.metrics_windows[stream_id] = MetricsWindow()
         self.health_states[stream_id] = StreamHealth()
         self.previous_states[stream_id] = HealthState.GREEN
@@ -162,11 +526,21 @@ class StreamMonitor:
         self.consecutive_error_counts[stream_id] = 0
         
         # Metrics history for charts
-        self.metrics_history[stream_id] = deque(maxlen=self.HISTORY_MAX_ITEMS)
+        self.metrics_history[stream_id] = MetricsRing()
         self.health_history[stream_id] = deque(maxlen=self.HISTORY_MAX_ITEMS)
         
-        task = asyncio.create_task(self._monitor_stream(stream_config))
-        self.monitoring_tasks[stream_id] = task
+        self._refresh_summary(stream_id)
+        
+        queue = asyncio.Queue(maxsize=settings.SEGMENT_QUEUE_SIZE)
+        self.segment_queues[stream_id] = queue
+        self.segment_workers[stream_id] = [
+            asyncio.create_task(self._segment_worker(stream_id, queue))
+            for _ in range(settings.MAX_CONCURRENT_SEGMENTS)
+        ]
+        
+        self.poll_urls[stream_id] = stream_config.manifest_url
+        self._ensure_scheduler()
+        self._schedule_poll(stream_id)  # first poll right away
         
         logger.info(f"Started monitoring: {stream_config.name} ({stream_id})")
     
@@ -175,20 +549,29 @@ class StreamMonitor:
         if stream_id not in self.active_streams:
             return
         
+        # Drops the pending heap entry lazily (see _run_scheduler)
+        self._next_poll.pop(stream_id, None)
+        self.poll_urls.pop(stream_id, None)
         if stream_id in self.monitoring_tasks:
             self.monitoring_tasks[stream_id].cancel()
             del self.monitoring_tasks[stream_id]
         
+        for worker in self.segment_workers.pop(stream_id, ()):
+            worker.cancel()
+        self.segment_queues.pop(stream_id, None)
+        
         # Cleanup all tracking data
         for store in [self.active_streams, self.seen_segments, self.metrics_windows,
                       self.health_states, self.previous_states, self.yellow_start_times,
-                      self.segment_counters, self.current_metrics]:
+                      self.segment_counters, self.current_metrics, self.metrics_history,
+                      self.health_history, self._error_bursts, self._manifest_validators]:
             if stream_id in store:
                 del store[stream_id]
         
         # Cleanup related services
         incident_service.cleanup_stream(stream_id)
         thumbnail_generator.cleanup_stream_thumbnails(stream_id)
+        self._refresh_summary(stream_id)
         
         logger.info(f"Stopped monitoring: {stream_id}")
     
@@ -197,31 +580,27 @@ class StreamMonitor:
         return len(self.active_streams)
     
     def get_stream_summary(self, stream_id: str) -> Optional[StreamSummary]:
-        """Get stream summary for list view."""
+        """Get stream summary for list view (from the snapshot)."""
+        return self._summaries.get(stream_id)
+    
+    def _build_summary(self, stream_id: str) -> Optional[StreamSummary]:
+        """Build a fresh stream summary from current state."""
         config = self.active_streams.get(stream_id)
         if not config:
             return None
         
         health = self.health_states.get(stream_id, StreamHealth())
         incident = incident_service.get_active_incident(stream_id)
-        thumbnail = thumbnail_generator.get_cached_thumbnail(stream_id)
-        
-        # Determine status based on health
-        if health.state == HealthState.RED:
-            status = StreamStatus.ERROR
-        elif health.state == HealthState.YELLOW:
-            status = StreamStatus.ONLINE
-        else:
-            status = StreamStatus.ONLINE
         
         return StreamSummary(
             id=stream_id,
             name=config.name,
-            status=status,
+            status=_STATE_TO_STATUS[health.state],
             health=health,
             has_active_incident=incident is not None,
             active_incident_id=incident.incident_id if incident else None,
-            thumbnail_url=f"/data/thumbnails/{Path(thumbnail).name}" if thumbnail else None
+            # URL built at write time - no path parsing or stat per summary
+            thumbnail_url=thumbnail_generator.get_cached_thumbnail_url(stream_id)
         )
     
     def get_stream_details(self, stream_id: str) -> Optional[StreamDetails]:
@@ -234,14 +613,6 @@ class StreamMonitor:
         incident = incident_service.get_active_incident(stream_id)
         current_metrics = self.current_metrics.get(stream_id)
         
-        # Determine status
-        if health.state == HealthState.RED:
-            status = StreamStatus.ERROR
-        elif health.state == HealthState.YELLOW:
-            status = StreamStatus.ONLINE
-        else:
-            status = StreamStatus.ONLINE
-        
         # Compute root cause classification
         root_cause = None
         if health.state != HealthState.GREEN:
@@ -253,16 +624,14 @@ class StreamMonitor:
                 consecutive_segment_errors=self.consecutive_error_counts.get(stream_id, 0)
             )
         
-        # Get recent timeline events (even without incident)
-        recent_events = []
-        if incident:
-            recent_events = incident.timeline[-20:]  # Last 20 events
+        # Recent timeline events (last 20) - the timeline lives on the active incident
+        recent_events = incident_service.get_timeline_tail(stream_id, 20) if incident else []
         
         return StreamDetails(
             id=stream_id,
             name=config.name,
             manifest_url=config.manifest_url,
-            status=status,
+            status=_STATE_TO_STATUS[health.state],
             health=health,
             created_at=config.created_at,
             root_cause=root_cause,
@@ -273,57 +642,223 @@ class StreamMonitor:
     
     def list_streams(self) -> List[StreamSummary]:
         """List all streams with summaries."""
-        return [
-            self.get_stream_summary(sid) 
-            for sid in self.active_streams.keys()
-        ]
+        return list(self._summaries.values())
+    
+    def get_summaries_json(self) -> bytes:
+        """Pre-serialized list view, re-encoded only after a state change."""
+        if self._summaries_json is None:
+            self._summaries_json = _SUMMARY_LIST_ADAPTER.dump_json(
+                list(self._summaries.values())
+            )
+        return self._summaries_json
+    
+    def get_summaries_etag(self) -> str:
+        """
+        Weak ETag identifying the current list-view snapshot.
+        
+        Weak on purpose: it ignores health.last_updated, so two bodies
+        under one ETag can differ in that stamp only.
+        """
+        return f'W/"{self._boot_id}-{self._summaries_version}"'
+    
+    def _refresh_summary(self, stream_id: str):
+        """
+        Rebuild one stream's summary and invalidate the serialized list.
+        
+        Called on health updates, incident open/resolve, thumbnail
+        updates and add/remove - the only events that change the list view.
+        """
+        summary = self._build_summary(stream_id)
+        if summary:
+            previous = self._summaries.get(stream_id)
+            self._summaries[stream_id] = summary
+            changed = not _same_list_view(previous, summary)
+        else:
+            changed = self._summaries.pop(stream_id, None) is not None
+        self._summaries_json = None
+        if changed:
+            self._summaries_version += 1
     
     # =========================================================================
     # MONITORING LOOP
     # =========================================================================
     
-    async def _monitor_stream(self, stream_config: StreamConfig):
-        """Main monitoring loop for a stream."""
-        stream_id = stream_config.id
-        current_url = stream_config.manifest_url
+    def _schedule_poll(self, stream_id: str, delay: float = 0.0):
+        """Queue the stream's next manifest poll (supersedes any pending one)."""
+        due = time.monotonic() + delay
+        self._next_poll[stream_id] = due
+        heapq.heappush(self._schedule, (due, stream_id))
+        self._schedule_changed.set()
+    
+    async def _run_scheduler(self):
+        """
+        Single scheduler for every stream's manifest polls.
         
+        Design: a min-heap of (due, stream_id) on the monotonic clock instead
+        of one sleeping `while True` task per stream. Entries are invalidated
+        lazily: one whose due time no longer matches _next_poll (stream removed
+        or rescheduled) is just dropped when popped.
+        """
+        schedule = self._schedule
         while True:
+            if schedule:
+                due, stream_id = schedule[0]
+                delay = due - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(schedule)
+                    if self._next_poll.get(stream_id) != due:
+                        continue  # superseded / stream removed
+                    try:
+                        if stream_id not in self.monitoring_tasks:
+                            self.monitoring_tasks[stream_id] = asyncio.create_task(self._poll_stream(stream_id))
+                    except Exception as e:
+                        # One bad entry must not stop polling for every stream
+                        logger.error(f"Scheduler failed to dispatch poll for {stream_id}: {e}")
+                        if stream_id in self.active_streams:
+                            self._schedule_poll(stream_id, settings.MANIFEST_POLL_INTERVAL)
+                    continue
+            else:
+                delay = None
+            
+            # Sleep until the earliest due poll, or until the schedule changes
+            self._schedule_changed.clear()
             try:
-                manifest_content = await self._fetch_manifest(current_url)
-                
-                if manifest_content:
-                    # Update to ONLINE if we were in error/starting
-                    variants, segments = self._parse_manifest(manifest_content, current_url)
-                    
-                    # Handle Master Playlist - drill down to variant
-                    if not segments and variants:
-                        best_variant = max(variants, key=lambda x: x.get('bandwidth', 0))
-                        current_url = best_variant['uri']
-                        continue
-                    
-                    # Process new segments
-                    for segment_url in segments:
-                        if segment_url not in self.seen_segments[stream_id]:
-                            self.seen_segments[stream_id].add(segment_url)
-                            asyncio.create_task(self._process_segment(stream_id, segment_url))
-                else:
-                    # Manifest fetch failed - record error
-                    await self._record_error(stream_id, "Manifest fetch failed")
-                
-                await asyncio.sleep(settings.MANIFEST_POLL_INTERVAL)
+                await asyncio.wait_for(self._schedule_changed.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _ensure_scheduler(self):
+        """Start the manifest scheduler if it isn't running (or has died)."""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+            self._scheduler_task.add_done_callback(self._on_scheduler_exit)
+    
+    def _on_scheduler_exit(self, task: asyncio.Task):
+        """Log whenever the scheduler stops - every stream's polling stops with it."""
+        if task.cancelled():
+            logger.info("Manifest scheduler stopped")
+        elif task.exception() is not None:
+            logger.error(f"Manifest scheduler crashed, polling halted for all streams: {task.exception()!r}")
+        else:
+            logger.error("Manifest scheduler exited unexpectedly, polling halted for all streams")
+    
+    async def _poll_stream(self, stream_id: str):
+        """One manifest poll for a stream; reschedules itself when done."""
+        try:
+            await self._poll_manifest(stream_id)
+        except asyncio.CancelledError:
+            raise  # stream removed / shutting down: no reschedule
+        except Exception as e:
+            logger.error(f"Error monitoring stream {stream_id}: {e}")
+            try:
+                if stream_id in self.active_streams:
+                    await self._record_error(stream_id, f"Monitoring error: {str(e)}")
+            except Exception as record_error:
+                logger.error(f"Error recording monitoring error for {stream_id}: {record_error}")
+        
+        if self.monitoring_tasks.get(stream_id) is asyncio.current_task():
+            del self.monitoring_tasks[stream_id]
+            if stream_id not in self.active_streams:
+                return
+            # Interval counts from the end of this poll, as the old per-stream loop did
+            self._schedule_poll(stream_id, settings.MANIFEST_POLL_INTERVAL)
+            try:
+                # Periodic tick even when nothing else happened (e.g. 304 polls)
+                self._flush_error_burst(stream_id, time.time_ns())
+            except Exception as e:
+                logger.error(f"Error flushing error burst for {stream_id}: {e}")
+    
+    async def _poll_manifest(self, stream_id: str):
+        """Fetch the stream's playlist and queue any new segments."""
+        current_url = self.poll_urls[stream_id]
+        
+        # Master playlist: drill down to the best variant (bounded hops)
+        for _ in range(self.MAX_VARIANT_HOPS + 1):
+            validators = self._manifest_validators.get(stream_id)
+            if validators is None or validators[0] != current_url:
+                validators = self._manifest_validators[stream_id] = [current_url, None, None, None]
             
-            except asyncio.CancelledError:
+            manifest_content = await self._fetch_manifest(current_url, validators)
+            if manifest_content is _MANIFEST_UNCHANGED:
+                return  # 304: nothing new since the last parse
+            if not manifest_content:
+                # Manifest fetch failed - record error
+                await self._record_error(stream_id, "Manifest fetch failed")
+                return
+            
+            # Origins without validators: same body as last poll, same segments
+            body_hash = hash(manifest_content)
+            if body_hash == validators[3]:
+                return
+            validators[3] = body_hash
+            
+            variants, segments = self._parse_manifest(manifest_content, current_url)
+            if segments or not variants:
                 break
-            except Exception as e:
-                logger.error(f"Error monitoring stream {stream_id}: {e}")
-                await self._record_error(stream_id, f"Monitoring error: {str(e)}")
-                await asyncio.sleep(settings.MANIFEST_POLL_INTERVAL)
+            best_variant = max(variants, key=lambda x: x.get('bandwidth', 0))
+            current_url = self.poll_urls[stream_id] = best_variant['uri']
+        else:
+            logger.error(f"No media playlist reachable for {stream_id}")
+            return
+        
+        # Queue new segments for the worker pool. On a full queue,
+        # stop here without marking the rest seen: they're retried
+        # next poll if still in the playlist (back-pressure).
+        seen = self.seen_segments[stream_id]
+        queue = self.segment_queues[stream_id]
+        for segment_url, duration in segments:
+            key = hash(segment_url)
+            if key not in seen:
+                try:
+                    queue.put_nowait((segment_url, duration))
+                except asyncio.QueueFull:
+                    logger.warning(f"Segment queue full for {stream_id}, deferring new segments")
+                    # Force a full fetch + parse next poll so the rest get queued
+                    validators[1:] = [None, None, None]
+                    break
+                seen[key] = None
+        
+        # Keep 2x the window; grow with the playlist so URLs still
+        # listed are never forgotten (and reprocessed)
+        limit = max(settings.HLS_WINDOW_SIZE, len(segments)) * 2
+        while len(seen) > limit:
+            seen.popitem(last=False)
+    
+    async def _segment_worker(self, stream_id: str, queue: asyncio.Queue):
+        """Drain a stream's segment queue (one of MAX_CONCURRENT_SEGMENTS)."""
+        while True:
+            segment_url, duration = await queue.get()
+            try:
+                await self._process_segment(stream_id, segment_url, duration)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A dead worker never comes back; keep draining the queue
+                logger.exception(f"Segment worker error for stream {stream_id}: {segment_url}")
     
-    async def _fetch_manifest(self, url: str) -> Optional[str]:
-        """Fetch HLS manifest."""
+    async def _fetch_manifest(self, url: str, validators: Optional[list] = None):
+        """
+        Fetch HLS manifest.
+        
+        With validators ([url, etag, last_modified, ...]) the request is
+        conditional: returns _MANIFEST_UNCHANGED on 304, and stores the
+        response's ETag/Last-Modified for the next poll.
+        """
+        headers = None
+        if validators is not None:
+            headers = {}
+            if validators[1]:
+                headers["If-None-Match"] = validators[1]
+            if validators[2]:
+                headers["If-Modified-Since"] = validators[2]
         try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            async with self.session.get(url, headers=headers, timeout=_MANIFEST_TIMEOUT) as response:
+                if response.status == 304:
+                    return _MANIFEST_UNCHANGED
                 if response.status == 200:
+                    if validators is not None:
+                        validators[1] = response.headers.get("ETag")
+                        validators[2] = response.headers.get("Last-Modified")
                     return await response.text()
                 logger.error(f"Manifest fetch failed: HTTP {response.status}")
                 return None
@@ -332,32 +867,23 @@ class StreamMonitor:
             return None
     
     def _parse_manifest(self, content: str, base_url: str) -> tuple:
-        """Parse HLS manifest to extract variants and segments."""
-        lines = content.split('\n')
+        """
+        Parse HLS manifest to extract variants and segments.
+        
+        One regex pass per tag type over the raw text - no line list, no
+        per-line strip()/startswith().
+        """
         variants = []
-        segments = []
+        for match in _VARIANT_RE.finditer(content):
+            info = self._parse_stream_inf(match.group(1))
+            info['uri'] = _resolve_uri(base_url, match.group(2))
+            variants.append(info)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if line.startswith('#EXT-X-STREAM-INF:'):
-                info = self._parse_stream_inf(line)
-                if i + 1 < len(lines):
-                    uri = lines[i + 1].strip()
-                    if uri and not uri.startswith('#'):
-                        info['uri'] = urljoin(base_url, uri)
-                        variants.append(info)
-                i += 1
-            
-            elif line.startswith('#EXTINF:'):
-                if i + 1 < len(lines):
-                    uri = lines[i + 1].strip()
-                    if uri and not uri.startswith('#'):
-                        segments.append(urljoin(base_url, uri))
-                i += 1
-            
-            i += 1
+        # (url, EXTINF duration or None)
+        segments = [
+            (_resolve_uri(base_url, match.group(2)), _parse_duration(match.group(1)))
+            for match in _SEGMENT_RE.finditer(content)
+        ]
         
         return variants, segments
     
@@ -365,18 +891,19 @@ class StreamMonitor:
         """Parse #EXT-X-STREAM-INF attributes."""
         info = {}
         
-        bandwidth_match = re.search(r'BANDWIDTH=(\d+)', line)
+        bandwidth_match = _BANDWIDTH_RE.search(line)
         if bandwidth_match:
             info['bandwidth'] = int(bandwidth_match.group(1))
         
-        resolution_match = re.search(r'RESOLUTION=(\d+x\d+)', line)
+        resolution_match = _RESOLUTION_RE.search(line)
         if resolution_match:
             info['resolution'] = resolution_match.group(1)
         
         return info
     
-    async def _process_segment(self, stream_id: str, segment_url: str):
-        """Download and process a segment."""
+    async def _process_segment(self, stream_id: str, segment_url: str,
+                               duration: Optional[float] = None):
+        """Download and process a segment (duration from EXTINF when known)."""
         try:
             segment_data = await self._download_segment(segment_url)
             
@@ -384,16 +911,14 @@ class StreamMonitor:
                 await self._record_error(stream_id, f"Segment download failed: {segment_url}")
                 return
             
-            # Save segment temporarily for duration probe and thumbnail
+            # Segment bytes stay in memory; ffmpeg/ffprobe read them via stdin
             seq = self.segment_counters.get(stream_id, 0)
-            segment_filename = f"{stream_id}_{seq}.ts"
-            segment_path = self.segments_dir / segment_filename
-            
-            with open(segment_path, 'wb') as f:
-                f.write(segment_data['content'])
             
-            # Probe duration
-            duration = await self._probe_duration(str(segment_path))
+            # Duration: manifest EXTINF, else PCR span, else ffprobe
+            if not duration:
+                duration = _ts_pcr_duration(segment_data['content'])
+            if not duration:
+                duration = await self._probe_duration(segment_data['content'])
             if not duration:
                 duration = 6.0  # Default fallback
             
@@ -401,15 +926,16 @@ class StreamMonitor:
             download_time_sec = segment_data['download_time'] / 1000
             download_ratio = duration / download_time_sec if download_time_sec > 0 else 1.0
             
-            # Create metrics
-            metrics = SegmentMetrics(
+            # Create metrics (trusted, already-typed values: skip validation)
+            now_ns = time.time_ns()
+            metrics = SegmentMetrics.model_construct(
                 uri=segment_url,
                 segment_duration=duration,
                 ttfb=segment_data['ttfb'],
                 download_time=segment_data['download_time'],
                 download_ratio=download_ratio,
                 segment_size_bytes=segment_data['size'],
-                timestamp=datetime.utcnow(),
+                timestamp_ns=now_ns,
                 sequence_number=seq,
                 is_error=False
             )
@@ -417,20 +943,26 @@ class StreamMonitor:
             # Update tracking
             self.current_metrics[stream_id] = metrics
             self.metrics_windows[stream_id].add(metrics)
+            self.metrics_history[stream_id].add(metrics)
             self.segment_counters[stream_id] = seq + 1
             
             # Update health and check for incidents
-            await self._update_health(stream_id)
+            await self._update_health(stream_id, now_ns)
             
             # Generate thumbnail (best-effort, don't block)
-            asyncio.create_task(self._generate_thumbnail(stream_id, str(segment_path), seq))
+            asyncio.create_task(self._generate_thumbnail(
+                stream_id, segment_data['content'], seq, duration / 2
+            ))
             
-            # Broadcast update
-            await self._broadcast_event(stream_id, "segment_processed", {
+            # Broadcast update (window extremes are O(1) reads)
+            window = self.metrics_windows[stream_id]
+            self._broadcast_event(stream_id, "segment_processed", {
                 "sequence": seq,
                 "ttfb": metrics.ttfb,
                 "download_time": metrics.download_time,
-                "download_ratio": metrics.download_ratio
+                "download_ratio": metrics.download_ratio,
+                "peak_ttfb_2min": window.get_max_ttfb(),
+                "min_download_ratio_2min": window.get_min_download_ratio()
             })
         
         except Exception as e:
@@ -440,20 +972,39 @@ class StreamMonitor:
     async def _download_segment(self, url: str) -> Optional[dict]:
         """Download segment with TTFB and timing measurement."""
         try:
-            ttfb_start = time.time()
+            # Monotonic clock for durations; headers-received doubles as body start
+            ttfb_start = time.perf_counter()
             
-            async with self.session.get(
-                url, 
-                timeout=aiohttp.ClientTimeout(total=settings.DOWNLOAD_TIMEOUT)
-            ) as response:
+            # Session default timeout (_SEGMENT_TIMEOUT) applies
+            async with self.session.get(url) as response:
                 if response.status != 200:
                     return None
                 
-                ttfb = (time.time() - ttfb_start) * 1000
-                download_start = time.time()
+                download_start = time.perf_counter()
+                ttfb = (download_start - ttfb_start) * 1000
                 
-                content = await response.read()
-                download_time = (time.time() - download_start) * 1000
+                # Stream the body into one buffer pre-sized from Content-Length.
+                # read() holds its chunk list and the joined copy at once; this
+                # keeps a single segment-sized buffer (grown only if the length
+                # was missing or wrong). Consumers take any bytes-like object.
+                # Content-Length is the origin's claim, so both the pre-size
+                # and the body are capped at MAX_SEGMENT_BYTES.
+                max_bytes = settings.MAX_SEGMENT_BYTES
+                expected = response.content_length
+                if expected and expected > max_bytes:
+                    logger.error(f"Segment too large ({expected} bytes > {max_bytes}): {url}")
+                    return None
+                content = bytearray(expected) if expected else bytearray()
+                size = 0
+                async for chunk in response.content.iter_chunked(settings.SEGMENT_BUFFER_SIZE):
+                    end = size + len(chunk)
+                    if end > max_bytes:
+                        logger.error(f"Segment exceeded {max_bytes} bytes, aborting download: {url}")
+                        return None
+                    content[size:end] = chunk
+                    size = end
+                del content[size:]
+                download_time = (time.perf_counter() - download_start) * 1000
                 
                 return {
                     'ttfb': ttfb,
@@ -469,20 +1020,21 @@ class StreamMonitor:
             logger.error(f"Segment download error: {e}")
             return None
     
-    async def _probe_duration(self, file_path: str) -> Optional[float]:
-        """Use ffprobe to get segment duration."""
+    async def _probe_duration(self, data: bytes) -> Optional[float]:
+        """Use ffprobe to get segment duration (bytes piped via stdin)."""
         try:
             process = await asyncio.create_subprocess_exec(
                 'ffprobe',
                 '-v', 'error',
                 '-show_entries', 'format=duration',
                 '-of', 'default=noprint_wrappers=1:nokey=1',
-                file_path,
+                'pipe:0',
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5.0)
+            stdout, _ = await asyncio.wait_for(process.communicate(input=data), timeout=5.0)
             
             if process.returncode == 0:
                 return float(stdout.decode().strip())
@@ -490,67 +1042,115 @@ class StreamMonitor:
         except:
             return None
     
-    async def _generate_thumbnail(self, stream_id: str, segment_path: str, sequence: int):
+    async def _generate_thumbnail(self, stream_id: str, segment_data: bytes, sequence: int,
+                                  timestamp: Optional[float] = None):
         """Generate thumbnail for segment (best-effort)."""
         try:
             thumbnail_path = await thumbnail_generator.generate_thumbnail_for_segment(
-                stream_id, "", segment_path, sequence
+                stream_id, "", segment_data, sequence, timestamp
             )
             
             if thumbnail_path:
                 # Add to incident timeline if there's an active incident
-                incident = incident_service.get_active_incident(stream_id)
-                if incident:
-                    relative_url = f"/data/thumbnails/{Path(thumbnail_path).name}"
+                if incident_service.has_active_incident(stream_id):
                     incident_service.add_timeline_event(
                         stream_id,
                         TimelineEventType.SEGMENT_OK,
                         f"Segment {sequence} processed",
-                        thumbnail_url=relative_url
+                        thumbnail_url=thumbnail_generator.get_thumbnail_url(stream_id, sequence)
                     )
+                
+                self._refresh_summary(stream_id)
         except Exception as e:
             logger.debug(f"Thumbnail generation failed: {e}")
     
     async def _record_error(self, stream_id: str, message: str):
         """Record a segment error."""
-        error_metric = SegmentMetrics(
+        now_ns = time.time_ns()
+        error_metric = SegmentMetrics.model_construct(
             uri="",
-            segment_duration=0,
-            ttfb=0,
-            download_time=0,
-            download_ratio=0,
+            segment_duration=0.0,
+            ttfb=0.0,
+            download_time=0.0,
+            download_ratio=0.0,
             segment_size_bytes=0,
-            timestamp=datetime.utcnow(),
+            timestamp_ns=now_ns,
             is_error=True,
             error_message=message
         )
         
+        # Always counted (O(1)): health math sees every error
         self.metrics_windows[stream_id].add(error_metric)
+        self.metrics_history[stream_id].add(error_metric)
         
-        # Add to incident timeline if active
-        incident_service.add_timeline_event(
-            stream_id,
-            TimelineEventType.SEGMENT_ERROR,
-            message
-        )
-        
-        # Update health
-        await self._update_health(stream_id)
+        # Coalesce bursts: a repeat of the last error within ERROR_COALESCE_NS
+        # skips only the timeline/broadcast fan-out and is counted as pending.
+        # Pending repeats are emitted when the message changes, with the next
+        # repeat after the window, or by _flush_error_burst on a later tick.
+        burst = self._error_bursts.get(stream_id)
+        if burst is not None and burst[0] == message and now_ns - burst[1] < self.ERROR_COALESCE_NS:
+            burst[2] += 1
+        else:
+            repeats = 0
+            if burst is not None and burst[2]:
+                if burst[0] == message:
+                    repeats = burst[2]  # folded into this event
+                else:
+                    self._emit_error_repeats(stream_id, burst[0], burst[2], now_ns)
+            self._error_bursts[stream_id] = [message, now_ns, 0]
+            self._emit_error(stream_id, message, repeats, now_ns)
         
-        # Broadcast error
-        await self._broadcast_event(stream_id, "error", {"message": message})
+        # Health always sees every error (window add above is O(1))
+        await self._update_health(stream_id, now_ns)
+    
+    def _emit_error(self, stream_id: str, message: str, repeats: int, now_ns: int):
+        """Timeline + broadcast for one error (plus repeats folded into it)."""
+        if incident_service.has_active_incident(stream_id):
+            incident_service.add_timeline_event(
+                stream_id,
+                TimelineEventType.SEGMENT_ERROR,
+                f"{message} (+{repeats} repeats)" if repeats else message,
+                now=from_epoch_ns(now_ns)
+            )
+        self._broadcast_event(stream_id, "error", {"message": message, "repeats": repeats})
+    
+    def _emit_error_repeats(self, stream_id: str, message: str, repeats: int, now_ns: int):
+        """Timeline + broadcast reporting repeats of an already-emitted error."""
+        if incident_service.has_active_incident(stream_id):
+            incident_service.add_timeline_event(
+                stream_id,
+                TimelineEventType.SEGMENT_ERROR,
+                f"{message} (repeated {repeats} more times)",
+                metadata={"repeats": repeats},
+                now=from_epoch_ns(now_ns)
+            )
+        self._broadcast_event(stream_id, "error", {"message": message, "repeats": repeats, "coalesced": True})
     
-    async def _update_health(self, stream_id: str):
+    def _flush_error_burst(self, stream_id: str, now_ns: int):
+        """Emit a burst's pending repeats once its coalescing window has passed."""
+        burst = self._error_bursts.get(stream_id)
+        if burst is not None and burst[2] and now_ns - burst[1] >= self.ERROR_COALESCE_NS:
+            self._emit_error_repeats(stream_id, burst[0], burst[2], now_ns)
+            burst[1] = now_ns
+            burst[2] = 0
+    
+    async def _update_health(self, stream_id: str, now_ns: Optional[int] = None):
         """Update health state and check for incidents."""
         if stream_id not in self.metrics_windows:
             return
         
         window = self.metrics_windows[stream_id]
         
+        # One wall-clock read per tick (or the caller's), threaded through every callee
+        if now_ns is None:
+            now_ns = time.time_ns()
+        now = from_epoch_ns(now_ns)
+        
+        # Health tick: report any error burst that has gone quiet
+        self._flush_error_burst(stream_id, now_ns)
+        
         # Compute metrics for health
-        error_count = window.get_error_count()
-        avg_ttfb = window.get_avg_ttfb()
-        avg_download_ratio = window.get_avg_download_ratio()
+        error_count, avg_ttfb, avg_download_ratio = window.snapshot(now_ns)
         
         # Compute new health state
         state, reason = health_service.compute_health(
@@ -563,7 +1163,7 @@ class StreamMonitor:
         health = StreamHealth(
             state=state,
             reason=reason,
-            last_updated=datetime.utcnow(),
+            last_updated=now,
             error_count_2min=error_count,
             avg_ttfb_ms=avg_ttfb,
             avg_download_ratio=avg_download_ratio
@@ -572,63 +1172,83 @@ class StreamMonitor:
         previous_state = self.previous_states.get(stream_id, HealthState.GREEN)
         self.health_states[stream_id] = health
         
+        # Read once per tick and branched on below; the incident object itself
+        # is only fetched (by create/resolve) when its fields are needed
+        has_incident = incident_service.has_active_incident(stream_id)
+        
         # Check for state changes
         if state != previous_state:
-            incident_service.add_timeline_event(
-                stream_id,
-                TimelineEventType.HEALTH_CHANGE,
-                f"Health changed from {previous_state.value.upper()} to {state.value.upper()}: {reason}"
-            )
+            # Transition log for Analysis Mode: plain (int, str) tuples, converted
+            # to ISO-8601 only when the history endpoint serializes them
+            self.health_history[stream_id].append((now_ns, state.value))
+            
+            # Only format the message when there's a timeline to attach it to
+            if has_incident:
+                incident_service.add_timeline_event(
+                    stream_id,
+                    TimelineEventType.HEALTH_CHANGE,
+                    f"Health changed from {previous_state.value.upper()} to {state.value.upper()}: {reason}",
+                    now=now
+                )
             
             # Broadcast health change
-            await self._broadcast_event(stream_id, "health_change", {
+            self._broadcast_event(stream_id, "health_change", {
                 "state": state.value,
                 "reason": reason,
                 "previous": previous_state.value
             })
         
-        # Track YELLOW duration
+        # Track YELLOW duration (monotonic: immune to wall-clock steps)
         if state == HealthState.YELLOW:
-            if stream_id not in self.yellow_start_times:
-                self.yellow_start_times[stream_id] = datetime.utcnow()
-            yellow_duration = (datetime.utcnow() - self.yellow_start_times[stream_id]).total_seconds()
+            now_mono = time.monotonic()
+            yellow_duration = now_mono - self.yellow_start_times.setdefault(stream_id, now_mono)
         else:
             self.yellow_start_times.pop(stream_id, None)
             yellow_duration = 0
         
-        # Check if we should create an incident
-        should_create, trigger_reason = health_service.should_create_incident(
-            current_state=state,
-            previous_state=previous_state,
-            yellow_duration_seconds=yellow_duration
-        )
-        
-        if should_create and not incident_service.get_active_incident(stream_id):
-            incident = incident_service.create_incident(stream_id, trigger_reason, health)
-            await self._broadcast_event(stream_id, "incident_created", {
-                "incident_id": incident.incident_id,
-                "trigger": trigger_reason
-            })
+        if not has_incident:
+            # Check if we should create an incident (moot while one is open)
+            should_create, trigger_reason = health_service.should_create_incident(
+                current_state=state,
+                previous_state=previous_state,
+                yellow_duration_seconds=yellow_duration
+            )
+            
+            if should_create:
+                incident = incident_service.create_incident(stream_id, trigger_reason, health, now=now)
+                self._broadcast_event(stream_id, "incident_created", {
+                    "incident_id": incident.incident_id,
+                    "trigger": trigger_reason
+                })
         
         # Check if incident should auto-resolve
-        if state == HealthState.GREEN and incident_service.get_active_incident(stream_id):
-            resolved = incident_service.resolve_incident(stream_id, "Health returned to GREEN")
+        elif state == HealthState.GREEN:
+            resolved = incident_service.resolve_incident(stream_id, "Health returned to GREEN", now=now)
             if resolved:
-                await self._broadcast_event(stream_id, "incident_resolved", {
+                self._broadcast_event(stream_id, "incident_resolved", {
                     "incident_id": resolved.incident_id
                 })
         
         self.previous_states[stream_id] = state
+        self._refresh_summary(stream_id)
     
-    async def _broadcast_event(self, stream_id: str, event_type: str, data: dict):
-        """Broadcast event via WebSocket."""
-        message = {
+    def _broadcast_event(self, stream_id: str, event_type: str, data: dict):
+        """
+        Broadcast event via WebSocket (fire-and-forget).
+        
+        Only enqueues onto each connection's outbound queue - the per-connection
+        drain tasks do the sends, so a slow client never stalls monitoring.
+        """
+        if not ws_manager.has_subscribers(stream_id):
+            return
+        
+        # Encoded once here; every connection gets the same bytes
+        ws_manager.broadcast(stream_id, orjson.dumps({
             "type": event_type,
             "stream_id": stream_id,
             "data": data,
             "timestamp": datetime.utcnow().isoformat()
-        }
-        await ws_manager.broadcast(stream_id, message)
+        }, default=str))
 
 
 # Global instance
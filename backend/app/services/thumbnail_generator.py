@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional, Dict, Tuple
@@ -32,6 +33,12 @@ class ThumbnailGenerator:
         # Cache: stream_id -> (thumbnail_path, timestamp, sequence)
         self._cache: Dict[str, Tuple[str, float, int]] = {}
         
+        # stream_id -> stat of the cached thumbnail, captured once at write time
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        
+        # stream_id -> public URL of the cached thumbnail, built once at write time
+        self._url_cache: Dict[str, str] = {}
+        
         # Track all generated thumbnails for cleanup
         self._thumbnail_registry: Dict[str, Dict[int, Tuple[str, float]]] = {}  # stream_id -> {seq: (path, time)}
     
@@ -57,6 +64,53 @@ class ThumbnailGenerator:
         
         return None
     
+    def get_cached_thumbnail_stat(self, stream_id: str) -> Optional[Tuple[str, os.stat_result]]:
+        """
+        Get cached thumbnail path with the stat captured when it was written.
+        
+        Same TTL rules as get_cached_thumbnail, but without an exists()
+        call - lets the file endpoint serve without any stat() syscalls.
+        
+        Returns:
+            (path, stat_result) or None if cache expired/missing
+        """
+        entry = self._cache.get(stream_id)
+        stat_result = self._stat_cache.get(stream_id)
+        if not entry or not stat_result:
+            return None
+        
+        path, cached_time, _ = entry
+        if time.time() - cached_time >= self.CACHE_TTL:
+            return None
+        
+        return path, stat_result
+    
+    def invalidate_cached_thumbnail(self, stream_id: str, path: str):
+        """
+        Drop the cached thumbnail entry if it still points at `path`.
+        
+        Called when the file turned out to be gone (deleted on disk) so
+        the stale stat isn't served again until the TTL runs out. A newer
+        thumbnail written in the meantime is left alone.
+        """
+        entry = self._cache.get(stream_id)
+        if entry and entry[0] == path:
+            del self._cache[stream_id]
+            self._stat_cache.pop(stream_id, None)
+            self._url_cache.pop(stream_id, None)
+    
+    def get_cached_thumbnail_url(self, stream_id: str) -> Optional[str]:
+        """
+        Get the cached thumbnail's /data/thumbnails/... URL.
+        
+        Same TTL rules as get_cached_thumbnail_stat; the string is built
+        when the thumbnail is written, so reads do no path parsing.
+        """
+        entry = self._cache.get(stream_id)
+        if not entry or time.time() - entry[1] >= self.CACHE_TTL:
+            return None
+        return self._url_cache.get(stream_id)
+    
     def get_latest_thumbnail_info(self, stream_id: str) -> Optional[Dict]:
         """
         Get information about the latest cached thumbnail.
@@ -80,13 +134,15 @@ class ThumbnailGenerator:
             "is_fresh": time.time() - cached_time < self.CACHE_TTL
         }
     
-    async def extract_thumbnail(self, segment_path: str, output_path: str, 
+    async def extract_thumbnail(self, segment_data: bytes, output_path: str, 
                                 timestamp: float = None) -> bool:
         """
-        Extract a thumbnail from a segment file using FFmpeg.
+        Extract a thumbnail from in-memory segment bytes using FFmpeg.
+        
+        The segment is piped to ffmpeg's stdin - it never touches disk.
         
         Args:
-            segment_path: Path to the segment file
+            segment_data: Raw segment bytes
             output_path: Path where thumbnail should be saved
             timestamp: Timestamp in seconds (uses mid-point if None)
         
@@ -97,7 +153,7 @@ class ThumbnailGenerator:
             # If no timestamp, extract from middle
             if timestamp is None:
                 # Get duration first
-                duration = await self._get_duration(segment_path)
+                duration = await self._get_duration(segment_data)
                 if duration:
                     timestamp = duration / 2
                 else:
@@ -107,7 +163,7 @@ class ThumbnailGenerator:
             command = [
                 'ffmpeg',
                 '-ss', str(timestamp),
-                '-i', segment_path,
+                '-i', 'pipe:0',
                 '-vframes', '1',
                 '-vf', f'scale={self.width}:{self.height}',
                 '-strict', 'unofficial',  # Allow non-standard YUV
@@ -117,41 +173,43 @@ class ThumbnailGenerator:
             
             process = await asyncio.create_subprocess_exec(
                 *command,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await process.communicate()
+            stdout, stderr = await process.communicate(input=segment_data)
             
             if process.returncode == 0:
                 logger.debug(f"Thumbnail generated: {output_path}")
                 return True
             else:
-                logger.warning(f"FFmpeg error for {segment_path}: {stderr.decode()[:200]}")
+                logger.warning(f"FFmpeg error for {output_path}: {stderr.decode()[:200]}")
                 return False
         
         except Exception as e:
             logger.error(f"Error extracting thumbnail: {e}")
             return False
     
-    async def _get_duration(self, segment_path: str) -> Optional[float]:
-        """Get duration of a video file using FFprobe."""
+    async def _get_duration(self, segment_data: bytes) -> Optional[float]:
+        """Get duration of in-memory segment bytes using FFprobe (via stdin)."""
         try:
             command = [
                 'ffprobe',
                 '-v', 'error',
                 '-show_entries', 'format=duration',
                 '-of', 'default=noprint_wrappers=1:nokey=1',
-                segment_path
+                'pipe:0'
             ]
             
             process = await asyncio.create_subprocess_exec(
                 *command,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             
-            stdout, stderr = await process.communicate()
+            stdout, stderr = await process.communicate(input=segment_data)
             
             if process.returncode == 0:
                 output = stdout.decode().strip()
@@ -200,7 +258,8 @@ class ThumbnailGenerator:
             return False
     
     async def generate_thumbnail_for_segment(self, stream_id: str, segment_uri: str, 
-                                              segment_path: str, sequence: int) -> Optional[str]:
+                                              segment_data: bytes, sequence: int,
+                                              timestamp: Optional[float] = None) -> Optional[str]:
         """
         Generate thumbnail for a segment and return the path.
         Updates the cache with the new thumbnail.
@@ -208,8 +267,9 @@ class ThumbnailGenerator:
         Args:
             stream_id: Stream identifier
             segment_uri: URI of the segment
-            segment_path: Local path to downloaded segment
+            segment_data: Downloaded segment bytes
             sequence: Sequence number
+            timestamp: Frame time in seconds (probed mid-point if None)
         
         Returns:
             Path to thumbnail or None if failed
@@ -219,7 +279,7 @@ class ThumbnailGenerator:
         output_path = str(self.thumbnails_dir / filename)
         
         # Try to extract thumbnail
-        success = await self.extract_thumbnail(segment_path, output_path)
+        success = await self.extract_thumbnail(segment_data, output_path, timestamp)
         
         if not success:
             # Generate error thumbnail
@@ -228,6 +288,11 @@ class ThumbnailGenerator:
         # Update cache
         current_time = time.time()
         self._cache[stream_id] = (output_path, current_time, sequence)
+        self._url_cache[stream_id] = self.get_thumbnail_url(stream_id, sequence)
+        try:
+            self._stat_cache[stream_id] = os.stat(output_path)
+        except OSError:
+            self._stat_cache.pop(stream_id, None)
         
         # Register thumbnail
         if stream_id not in self._thumbnail_registry:
@@ -271,6 +336,8 @@ class ThumbnailGenerator:
             # Remove from cache
             if stream_id in self._cache:
                 del self._cache[stream_id]
+            self._stat_cache.pop(stream_id, None)
+            self._url_cache.pop(stream_id, None)
             
             # Remove registered thumbnails
             if stream_id in self._thumbnail_registry:
@@ -3,24 +3,53 @@ import logging
 from typing import Dict, Set
 from fastapi import WebSocket
 from datetime import datetime
-import json
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
 class WebSocketManager:
+    """
+    Per-stream WebSocket fan-out with batched delivery.
+    
+    Broadcasts arrive pre-serialized (encoded once, however many
+    listeners) and are queued per connection; a drain task per connection
+    collects everything that arrives within BATCH_WINDOW_SECONDS and
+    sends it as one JSON array frame. A slow client only backs up its
+    own queue (oldest messages dropped when full).
+    
+    Wire protocol: every frame is a JSON array of message objects, e.g.
+    [{"type": "connected", ...}] or [{"type": "segment", ...}, {...}].
+    Clients iterate the array; there is no bare-object frame. All sends,
+    personal ones included, go through the connection's queue so the
+    drain task is the only writer on the socket.
+    """
+    
+    BATCH_WINDOW_SECONDS = 0.05
+    QUEUE_MAX_SIZE = 1024
+    
     def __init__(self):
         # stream_id -> set of WebSocket connections
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self._lock = asyncio.Lock()
+        
+        # Per-connection outbound queue and its drain task
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._drain_tasks: Dict[WebSocket, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, stream_id: str):
         """Accept and register a WebSocket connection for a stream."""
         await websocket.accept()
+        queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
         async with self._lock:
             if stream_id not in self.active_connections:
                 self.active_connections[stream_id] = set()
             self.active_connections[stream_id].add(websocket)
+            self._queues[websocket] = queue
+            self._drain_tasks[websocket] = asyncio.create_task(
+                self._drain(websocket, stream_id, queue)
+            )
         logger.info(f"WebSocket connected to stream {stream_id}. Total: {len(self.active_connections[stream_id])}")
     
     async def disconnect(self, websocket: WebSocket, stream_id: str):
@@ -30,44 +59,72 @@ class WebSocketManager:
                 self.active_connections[stream_id].discard(websocket)
                 if not self.active_connections[stream_id]:
                     del self.active_connections[stream_id]
+            self._queues.pop(websocket, None)
+            task = self._drain_tasks.pop(websocket, None)
+        
+        # The drain task disconnects itself on send failure - don't cancel it mid-cleanup
+        if task and task is not asyncio.current_task():
+            task.cancel()
         logger.info(f"WebSocket disconnected from stream {stream_id}")
     
-    async def broadcast(self, stream_id: str, message: dict):
-        """Broadcast a message to all connections for a stream."""
-        if stream_id not in self.active_connections:
-            return
-        
-        # Add timestamp if not present
-        if "timestamp" not in message:
-            message["timestamp"] = datetime.utcnow().isoformat()
+    def has_subscribers(self, stream_id: str) -> bool:
+        """True if any client is connected (lets callers skip serializing)."""
+        return stream_id in self.active_connections
+    
+    def _enqueue(self, websocket: WebSocket, payload: bytes) -> bool:
+        """Queue a serialized message for one connection (False if it's gone)."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        if queue.full():
+            # Slow client: drop its oldest pending message rather than block
+            queue.get_nowait()
+        queue.put_nowait(payload)
+        return True
+    
+    def broadcast(self, stream_id: str, payload: bytes):
+        """
+        Queue a serialized JSON message for all connections of a stream.
         
-        message_str = json.dumps(message, default=str)
+        Synchronous on purpose: it never awaits, so callers can't be
+        blocked by client I/O (and don't pay for a coroutine per call).
+        The same bytes object is shared by every connection's queue.
+        """
+        connections = self.active_connections.get(stream_id)
+        if not connections:
+            return
         
-        disconnected = set()
-        for connection in self.active_connections[stream_id]:
+        for connection in connections:
+            self._enqueue(connection, payload)
+    
+    async def _drain(self, websocket: WebSocket, stream_id: str, queue: asyncio.Queue):
+        """Send queued messages in time-windowed batches (one frame per window)."""
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            
             try:
-                await connection.send_text(message_str)
+                # Splice the already-encoded messages into one array frame
+                await websocket.send_text((b"[" + b",".join(batch) + b"]").decode())
             except Exception as e:
                 logger.error(f"Error sending to WebSocket: {e}")
-                disconnected.add(connection)
-        
-        # Clean up disconnected clients
-        if disconnected:
-            async with self._lock:
-                self.active_connections[stream_id] -= disconnected
-                if not self.active_connections[stream_id]:
-                    del self.active_connections[stream_id]
+                await self.disconnect(websocket, stream_id)
+                return
     
     async def send_personal(self, websocket: WebSocket, message: dict):
-        """Send a message to a specific WebSocket connection."""
+        """
+        Send a message to a specific WebSocket connection.
+        
+        Queued like broadcasts, so it arrives inside an array frame and
+        never races the drain task for the socket.
+        """
         if "timestamp" not in message:
             message["timestamp"] = datetime.utcnow().isoformat()
         
-        message_str = json.dumps(message, default=str)
-        try:
-            await websocket.send_text(message_str)
-        except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+        if not self._enqueue(websocket, orjson.dumps(message, default=str)):
+            logger.warning("Dropped personal message for a disconnected WebSocket")
     
     def get_connection_count(self, stream_id: str) -> int:
         """Get the number of active connections for a stream."""
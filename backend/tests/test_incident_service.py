@@ -0,0 +1,134 @@
+"""
+IncidentService indexes: get_all_incidents() merges the per-stream lists
+(each in started_at order) instead of sorting everything, and eviction /
+stream cleanup must keep by_id, incident_history and incidents_by_stream
+in step. These tests drive random lifecycles against a naive model.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import HealthState, StreamHealth
+from app.services.incident_service import IncidentService
+
+
+T0 = datetime(2026, 1, 1)
+STREAMS = [f"stream-{k}" for k in range(5)]
+
+
+def _health() -> StreamHealth:
+    return StreamHealth(state=HealthState.RED, reason="test")
+
+
+def _newest_first(incidents):
+    return sorted(incidents, key=lambda i: i.started_at, reverse=True)
+
+
+def _assert_consistent(service: IncidentService, active: dict, history: list):
+    """Service state matches the model and its indexes agree with each other."""
+    retained = list(active.values()) + history
+    
+    assert service.active_incidents == active
+    assert list(service.incident_history.values()) == history
+    assert len(service.incident_history) <= service.MAX_HISTORY
+    assert service.by_id == {i.incident_id: i for i in retained}
+    
+    indexed = [i for lst in service.incidents_by_stream.values() for i in lst]
+    assert sorted(i.incident_id for i in indexed) == sorted(i.incident_id for i in retained)
+    for stream_id, incidents in service.incidents_by_stream.items():
+        assert incidents, f"empty index list left for {stream_id}"
+        assert all(i.stream_id == stream_id for i in incidents)
+        assert [i.started_at for i in incidents] == sorted(i.started_at for i in incidents)
+    
+    assert service.get_all_incidents(active_only=False) == _newest_first(retained)
+    assert service.get_all_incidents(active_only=True) == _newest_first(active.values())
+    for stream_id in STREAMS:
+        mine = [i for i in retained if i.stream_id == stream_id]
+        assert service.get_all_incidents(stream_id, active_only=False) == _newest_first(mine)
+        assert service.get_all_incidents(stream_id, active_only=True) == (
+            [active[stream_id]] if stream_id in active else []
+        )
+    for incident in retained:
+        assert service.get_incident_by_id(incident.incident_id) is incident
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_lifecycle_matches_model(seed):
+    rng = random.Random(seed)
+    service = IncidentService()
+    active = {}
+    history = []  # resolution order, oldest first
+    now = T0
+    
+    for _ in range(400):
+        now += timedelta(seconds=rng.randint(1, 90))
+        stream_id = rng.choice(STREAMS)
+        roll = rng.random()
+        
+        if roll < 0.45:
+            incident = service.create_incident(stream_id, "degraded", _health(), now=now)
+            if stream_id in active:
+                assert incident is active[stream_id]  # no second active incident
+            else:
+                active[stream_id] = incident
+        elif roll < 0.85:
+            resolved = service.resolve_incident(stream_id, now=now)
+            if stream_id in active:
+                assert resolved is active.pop(stream_id)
+                if len(history) >= service.MAX_HISTORY:
+                    history.pop(0)  # oldest resolved is evicted
+                history.append(resolved)
+            else:
+                assert resolved is None
+        elif roll < 0.93:
+            incident = active.get(stream_id)
+            if incident is not None:
+                assert service.acknowledge_incident(incident.incident_id, now=now) is incident
+        else:
+            service.cleanup_stream(stream_id)
+            active.pop(stream_id, None)
+            history = [i for i in history if i.stream_id != stream_id]
+        
+        _assert_consistent(service, active, history)
+
+
+def test_evicted_incident_is_unindexed():
+    service = IncidentService()
+    now = T0
+    first = None
+    for k in range(service.MAX_HISTORY + 1):
+        now += timedelta(minutes=1)
+        incident = service.create_incident("s", "degraded", _health(), now=now)
+        first = first or incident
+        service.resolve_incident("s", now=now)
+    
+    assert service.get_incident_by_id(first.incident_id) is None
+    assert first not in service.incidents_by_stream["s"]
+    assert len(service.get_all_incidents("s", active_only=False)) == service.MAX_HISTORY
+
+
+def test_cleanup_stream_drops_every_index():
+    service = IncidentService()
+    service.create_incident("a", "degraded", _health(), now=T0)
+    service.resolve_incident("a", now=T0 + timedelta(seconds=1))
+    kept = service.create_incident("b", "degraded", _health(), now=T0 + timedelta(seconds=2))
+    service.create_incident("a", "degraded", _health(), now=T0 + timedelta(seconds=3))
+    
+    service.cleanup_stream("a")
+    
+    assert "a" not in service.incidents_by_stream
+    assert "a" not in service.active_incidents
+    assert all(i.stream_id == "b" for i in service.incident_history.values())
+    assert list(service.by_id.values()) == [kept]
+    assert service.get_all_incidents(active_only=False) == [kept]
+
+
+def test_opening_event_shares_metrics_snapshot():
+    service = IncidentService()
+    incident = service.create_incident("s", "degraded", _health(), now=T0)
+    initial_event = incident.timeline[0]
+    
+    assert incident.metrics_snapshot is initial_event.metadata
+    assert incident.metrics_snapshot["reason"] == "test"
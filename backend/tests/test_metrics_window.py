@@ -0,0 +1,107 @@
+"""
+MetricsWindow keeps running totals (subtract-on-evict) and monotonic
+deques for the window extremes. These tests replay randomized metric
+sequences and compare every read against a naive recomputation over
+the entries that should still be live, across ring wraps (count
+eviction) and time-based expiry.
+"""
+
+import random
+
+import pytest
+
+from app.models import SegmentMetrics
+from app.services.stream_monitor import MetricsWindow
+
+
+SECOND_NS = 1_000_000_000
+START_NS = 1_700_000_000 * SECOND_NS
+
+
+def _metric(timestamp_ns: int, rng: random.Random, error_rate: float) -> SegmentMetrics:
+    if rng.random() < error_rate:
+        return SegmentMetrics(
+            uri="", segment_duration=0.0, ttfb=0.0, download_time=0.0,
+            download_ratio=0.0, segment_size_bytes=0,
+            timestamp_ns=timestamp_ns, is_error=True, error_message="boom"
+        )
+    return SegmentMetrics(
+        uri="seg.ts", segment_duration=6.0,
+        # Coarse values so ties exercise the deque's <= / >= pops
+        ttfb=float(rng.choice([rng.uniform(1, 2000), rng.randint(0, 5) * 100])),
+        download_time=500.0,
+        download_ratio=float(rng.choice([rng.uniform(0.1, 20), rng.randint(1, 4) * 0.5])),
+        segment_size_bytes=1000, timestamp_ns=timestamp_ns
+    )
+
+
+def _expected(live):
+    ok = [m for m in live if not m.is_error]
+    errors = len(live) - len(ok)
+    if not ok:
+        return errors, 0.0, 1.0, 0.0, 1.0
+    return (
+        errors,
+        sum(m.ttfb for m in ok) / len(ok),
+        sum(m.download_ratio for m in ok) / len(ok),
+        max(m.ttfb for m in ok),
+        min(m.download_ratio for m in ok),
+    )
+
+
+def _live(added, now_ns):
+    cutoff_ns = now_ns - MetricsWindow.MAX_AGE_NS
+    return [m for m in added[-MetricsWindow.MAX_ITEMS:] if m.timestamp_ns > cutoff_ns]
+
+
+def _check(window, added, now_ns):
+    errors, avg_ttfb, avg_ratio, peak_ttfb, min_ratio = _expected(_live(added, now_ns))
+    got_errors, got_ttfb, got_ratio = window.snapshot(now_ns)
+    assert got_errors == errors
+    assert got_ttfb == pytest.approx(avg_ttfb, rel=1e-9, abs=1e-9)
+    assert got_ratio == pytest.approx(avg_ratio, rel=1e-9, abs=1e-9)
+    assert window.get_max_ttfb(now_ns) == peak_ttfb
+    assert window.get_min_download_ratio(now_ns) == min_ratio
+    assert window.get_recent(now_ns) == _live(added, now_ns)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("error_rate", [0.0, 0.2, 0.9])
+def test_matches_naive_recompute(seed, error_rate):
+    rng = random.Random(seed)
+    window = MetricsWindow()
+    added = []
+    now_ns = START_NS
+    # Several ring wraps (MAX_ITEMS slots); gaps sometimes exceed the 2 min
+    # window so whole stretches expire, sometimes empty the window entirely
+    for _ in range(MetricsWindow.MAX_ITEMS * 8):
+        now_ns += rng.choice([0, SECOND_NS, 2 * SECOND_NS, 6 * SECOND_NS,
+                              45 * SECOND_NS, 150 * SECOND_NS])
+        metric = _metric(now_ns, rng, error_rate)
+        window.add(metric)
+        added.append(metric)
+        _check(window, added, now_ns)
+        if rng.random() < 0.1:
+            # Read later without adding: pure time-based expiry
+            now_ns += rng.randint(0, 130) * SECOND_NS
+            _check(window, added, now_ns)
+
+
+def test_empty_window_defaults():
+    window = MetricsWindow()
+    assert window.snapshot(START_NS) == (0, 0.0, 1.0)
+    assert window.get_max_ttfb(START_NS) == 0.0
+    assert window.get_min_download_ratio(START_NS) == 1.0
+    assert window.get_recent(START_NS) == []
+
+
+def test_fully_expired_window_resets_totals():
+    rng = random.Random(0)
+    window = MetricsWindow()
+    for k in range(MetricsWindow.MAX_ITEMS + 7):
+        window.add(_metric(START_NS + k * SECOND_NS, rng, 0.3))
+    later_ns = START_NS + 10_000 * SECOND_NS
+    assert window.snapshot(later_ns) == (0, 0.0, 1.0)
+    assert window.count == 0
+    assert window.get_max_ttfb(later_ns) == 0.0
+    assert window.get_min_download_ratio(later_ns) == 1.0
@@ -0,0 +1,78 @@
+"""
+_resolve_uri must match urllib's urljoin for every manifest URI shape.
+
+The fast paths are plain string concatenation, so this matrix pins them
+to urljoin's behaviour (including the ambiguous cases routed to it).
+"""
+
+import random
+from urllib.parse import urljoin
+
+import pytest
+
+from app.services.stream_monitor import _resolve_uri
+
+
+BASES = [
+    "http://cdn.example.com/live/stream/index.m3u8",
+    "https://cdn.example.com/live/stream/index.m3u8?token=abc",
+    "https://cdn.example.com/master.m3u8#frag",
+    "http://cdn.example.com",
+    "http://cdn.example.com/",
+    "http://cdn.example.com:8080/a/b/c/playlist.m3u8",
+    "https://user:pw@cdn.example.com/dir/",
+]
+
+URIS = [
+    "seg123.ts",
+    "720p/index.m3u8",
+    "/abs/seg.ts",
+    "seg.ts?x=1&y=2",
+    "seg.ts#t=10",
+    # "://" inside the query must not be mistaken for an absolute URI
+    "seg.ts?redirect=http://cdn/x",
+    "720p/index.m3u8?u=https://other.example.com/a/b",
+    "/abs/seg.ts?next=http://x/y",
+    "http://other.example.com/seg.ts",
+    "https://other.example.com/a/seg.ts?q=1",
+    "HTTP://Other.example.com/Seg.ts",
+    "http://other.example.com/a/../b/./seg.ts",
+    "//proto-relative.example.com/seg.ts",
+    "../up/seg.ts",
+    "./here/seg.ts",
+    "a/./b/../seg.ts",
+    "?only=query",
+    "#only-fragment",
+    "data:video/mp2t;base64,AAAA",
+    "urn:example:seg",
+    "seg:colon.ts",
+    "",
+    "seg with space.ts",
+    "seg%20encoded.ts",
+    " seg.ts",
+    "seg.ts\t",
+    "seg\n.ts",
+]
+
+
+@pytest.mark.parametrize("base", BASES)
+@pytest.mark.parametrize("uri", URIS)
+def test_matches_urljoin(base, uri):
+    assert _resolve_uri(base, uri) == urljoin(base, uri)
+
+
+def test_query_with_scheme_is_resolved_relative():
+    assert (
+        _resolve_uri("http://host/dir/index.m3u8", "seg.ts?redirect=http://cdn/x")
+        == "http://host/dir/seg.ts?redirect=http://cdn/x"
+    )
+
+
+def test_random_uris_match_urljoin():
+    rng = random.Random(1234)
+    pieces = ["seg", "a", "b", "/", "./", "../", "?", "#", "=", "&", ":", "://",
+              "http", "HTTP", "x.ts", ".", "%2F", "//", "v1", "@", ";", " ", "\t", "\\"]
+    for _ in range(20000):
+        base = rng.choice(BASES)
+        uri = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 6)))
+        assert _resolve_uri(base, uri) == urljoin(base, uri), (base, uri)
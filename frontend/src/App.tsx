@@ -264,14 +264,15 @@ const AnalysisPanel: React.FC<{ streamId: string }> = ({ streamId }) => {
         return <div className="text-gray-500 text-center py-8">Unable to load metrics data</div>
     }
 
-    // Transform data for charts
-    const ttfbData = history.data_points
-        .filter(d => !d.is_error)
-        .map((d, idx) => ({ x: idx, y: d.ttfb_ms }))
-
-    const ratioData = history.data_points
-        .filter(d => !d.is_error)
-        .map((d, idx) => ({ x: idx, y: d.download_ratio }))
+    // Transform columnar data for charts (skip error points)
+    const points = history.data_points
+    const ttfbData: { x: number; y: number }[] = []
+    const ratioData: { x: number; y: number }[] = []
+    points.is_error.forEach((isError, i) => {
+        if (isError) return
+        ttfbData.push({ x: ttfbData.length, y: points.ttfb_ms[i] })
+        ratioData.push({ x: ratioData.length, y: points.download_ratio[i] })
+    })
 
     const errorData = history.error_rate_series
         .map((d, idx) => ({ x: idx, y: d.error_count }))
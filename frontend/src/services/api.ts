@@ -92,11 +92,12 @@ export interface StreamDetails {
 }
 
 // Analysis Mode types
-export interface MetricsDataPoint {
-    timestamp: string
-    ttfb_ms: number
-    download_ratio: number
-    is_error: boolean
+// Data points are columnar: index i across all arrays is one segment
+export interface MetricsDataPoints {
+    timestamp_ms: number[]
+    ttfb_ms: number[]
+    download_ratio: number[]
+    is_error: boolean[]
 }
 
 export interface HealthTimelineEntry {
@@ -111,7 +112,7 @@ export interface ErrorRateEntry {
 
 export interface MetricsHistory {
     stream_id: string
-    data_points: MetricsDataPoint[]
+    data_points: MetricsDataPoints
     health_timeline: HealthTimelineEntry[]
     error_rate_series: ErrorRateEntry[]
 }